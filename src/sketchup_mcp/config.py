@@ -1,6 +1,7 @@
 """Centralized configuration for SketchUp MCP Server"""
 
 from dataclasses import dataclass, field
+import json
 import os
 
 
@@ -13,6 +14,10 @@ class MCPConfig:
     timeout: float = 15.0
     max_retries: int = 2
     buffer_size: int = 8192
+    # Maximum concurrent requests (one socket each). The extension serves
+    # one client at a time, so extra requests would only queue in its
+    # accept backlog and eat into the receive timeout.
+    pool_size: int = 1
 
     # Image export defaults
     default_image_width: int = 1920
@@ -24,6 +29,15 @@ class MCPConfig:
     auth_secret: str = field(
         default_factory=lambda: os.environ.get("SKETCHUP_MCP_SECRET", "")
     )
+    auth_handshake_bytes: bytes = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Encoded once; sent on every (re)connect when a secret is set
+        self.auth_handshake_bytes = (
+            json.dumps({"secret": self.auth_secret}).encode("utf-8") + b"\n"
+            if self.auth_secret
+            else b""
+        )
 
 
 # Global config instance
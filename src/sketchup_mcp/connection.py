@@ -1,16 +1,45 @@
 """SketchUp TCP Connection Management"""
 
+import functools
 import socket
 import json
 import logging
-from dataclasses import dataclass
-from typing import Dict, Any, Optional, Tuple
+import queue
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Any, Iterator, Optional, Tuple
 
 from .config import config
+from .serialization import dumps_bytes, loads
 
 logger = logging.getLogger("SketchupMCPServer")
 
 
+# Fixed head of every tools/call request, up to the tool name
+_REQUEST_PREFIX = b'{"jsonrpc":"2.0","method":"tools/call","params":{"name":'
+
+
+@functools.lru_cache(maxsize=None)
+def _request_head(tool_name: str) -> bytes:
+    """Encoded request envelope up to the arguments, per tool name."""
+    return _REQUEST_PREFIX + dumps_bytes(tool_name) + b',"arguments":'
+
+
+def _encode_request(
+    tool_name: str, arguments: Dict[str, Any], request_id: Any
+) -> bytes:
+    """Serialize a tools/call request without building the envelope dict."""
+    return b"".join(
+        (
+            _request_head(tool_name),
+            dumps_bytes(arguments),
+            b'},"id":',
+            dumps_bytes(request_id),
+            b"}\n",
+        )
+    )
+
+
 @dataclass
 class SketchupConnection:
     """Manages TCP connection to SketchUp extension"""
@@ -18,6 +47,11 @@ class SketchupConnection:
     host: str = "localhost"
     port: int = 9876
     sock: Optional[socket.socket] = None
+    # Whether sock was kept from an earlier connect() rather than just opened
+    _reused: bool = field(default=False, repr=False)
+    _recv_buf: bytearray = field(
+        default_factory=lambda: bytearray(config.buffer_size * 8), repr=False
+    )
 
     def connect(self) -> bool:
         """Connect to the SketchUp extension socket server"""
@@ -25,6 +59,7 @@ class SketchupConnection:
             try:
                 self.sock.settimeout(0.1)
                 self.sock.send(b"")
+                self._reused = True
                 return True
             except (socket.error, BrokenPipeError, ConnectionResetError):
                 logger.info("Connection test failed, reconnecting...")
@@ -32,87 +67,109 @@ class SketchupConnection:
 
         try:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._configure_socket(self.sock)
             self.sock.connect((self.host, self.port))
-            logger.info(f"Connected to SketchUp at {self.host}:{self.port}")
+            self._reused = False
+            logger.info("Connected to SketchUp at %s:%s", self.host, self.port)
 
             # Send authentication if secret is configured
-            if config.auth_secret:
-                auth_msg = json.dumps({"secret": config.auth_secret}) + "\n"
-                self.sock.sendall(auth_msg.encode("utf-8"))
+            if config.auth_handshake_bytes:
+                self.sock.sendall(config.auth_handshake_bytes)
                 logger.debug("Sent authentication")
 
             return True
         except Exception as e:
-            logger.error(f"Failed to connect to SketchUp: {str(e)}")
+            logger.error("Failed to connect to SketchUp: %s", e)
             if self.sock:
                 try:
                     self.sock.close()
                 except OSError as e:
-                    logger.debug(f"Expected error closing socket: {e}")
+                    logger.debug("Expected error closing socket: %s", e)
                 except Exception as e:
-                    logger.warning(f"Unexpected error closing socket: {e}")
+                    logger.warning("Unexpected error closing socket: %s", e)
             self.sock = None
             return False
 
+    @staticmethod
+    def _configure_socket(sock: socket.socket):
+        """Disable Nagle delays and keep idle connections alive"""
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+        # Keepalive tuning is platform-specific (Linux names shown)
+        for option, value in (
+            ("TCP_KEEPIDLE", 30),
+            ("TCP_KEEPINTVL", 10),
+            ("TCP_KEEPCNT", 3),
+        ):
+            if hasattr(socket, option):
+                sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+
+        # Room for large responses (e.g. cut lists) in one kernel buffer
+        kernel_buffer = config.buffer_size * 8
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, kernel_buffer)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, kernel_buffer)
+
     def disconnect(self):
         """Disconnect from the SketchUp extension"""
         if self.sock:
             try:
                 self.sock.close()
             except Exception as e:
-                logger.error(f"Error disconnecting: {str(e)}")
+                logger.error("Error disconnecting: %s", e)
             finally:
                 self.sock = None
 
-    def _receive_full_response(self, buffer_size: int = 8192) -> bytes:
-        """Receive complete JSON response, potentially in multiple chunks"""
-        chunks = []
+    def _receive_full_response(self, buffer_size: int = 8192) -> memoryview:
+        """
+        Receive one newline-delimited JSON response.
+
+        The extension writes each response as compact JSON followed by "\n",
+        so the message ends at the first newline; no trial parsing needed.
+        Data is read into a buffer reused across requests (replies too large
+        for it use a temporary, larger copy); the returned view is only valid
+        until the next receive.
+        """
+        buf = self._recv_buf
+        offset = 0
         self.sock.settimeout(15.0)
 
-        try:
-            while True:
-                try:
-                    chunk = self.sock.recv(buffer_size)
-                    if not chunk:
-                        if not chunks:
-                            raise Exception("Connection closed before receiving data")
-                        break
-
-                    chunks.append(chunk)
-
-                    # Try to parse as JSON to check if complete
-                    try:
-                        data = b"".join(chunks)
-                        json.loads(data.decode("utf-8"))
-                        return data
-                    except json.JSONDecodeError:
-                        continue
-
-                except socket.timeout:
-                    logger.debug(
-                        "Socket timeout while receiving - checking if response complete"
+        while True:
+            if len(buf) - offset < buffer_size:
+                # Grow into a temporary copy; the default-sized buffer is kept
+                # for the next request so one large reply doesn't pin memory
+                buf = buf + bytes(len(buf))
+            try:
+                received = self.sock.recv_into(memoryview(buf)[offset:])
+            except socket.timeout:
+                # Drop the socket so a late or half-read reply can't be
+                # read as the response to the next request
+                self.disconnect()
+                if offset:
+                    raise Exception(
+                        "Incomplete JSON response (possible timeout). "
+                        "Large operations may need to be broken into smaller chunks."
                     )
-                    break
-                except (ConnectionError, BrokenPipeError, ConnectionResetError) as e:
-                    raise Exception(f"Connection error: {str(e)}")
+                raise Exception("No data received (connection may have timed out)")
+            except (ConnectionError, BrokenPipeError, ConnectionResetError) as e:
+                if not offset:
+                    # Reset before any reply; send_command decides on retries
+                    raise
+                self.disconnect()
+                raise Exception(f"Connection error: {str(e)}")
 
-        except socket.timeout:
-            logger.warning(
-                "Socket timeout while receiving response - response may be incomplete"
-            )
+            if not received:
+                if not offset:
+                    # No reply; send_command decides on retries
+                    raise ConnectionError("Connection closed before receiving data")
+                # Peer closed without a delimiter; let the caller parse what arrived
+                return memoryview(buf)[:offset]
 
-        if chunks:
-            data = b"".join(chunks)
-            try:
-                json.loads(data.decode("utf-8"))
-                return data
-            except json.JSONDecodeError:
-                raise Exception(
-                    "Incomplete JSON response (possible timeout). "
-                    "Large operations may need to be broken into smaller chunks."
-                )
-        else:
-            raise Exception("No data received (connection may have timed out)")
+            # Only the newly received bytes are searched for the delimiter
+            end = buf.find(b"\n", offset, offset + received)
+            if end != -1:
+                return memoryview(buf)[:end]
+            offset += received
 
     def send_command(
         self, tool_name: str, arguments: Dict[str, Any] = None, request_id: Any = None
@@ -125,21 +182,18 @@ class SketchupConnection:
                 "(Extensions → SketchupMCP → Start Server)"
             )
 
-        request = {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "params": {"name": tool_name, "arguments": arguments or {}},
-            "id": request_id,
-        }
+        request_bytes = _encode_request(tool_name, arguments or {}, request_id)
 
         max_retries = 2
         for attempt in range(max_retries + 1):
+            reused = self._reused
             try:
-                request_bytes = json.dumps(request).encode("utf-8") + b"\n"
                 self.sock.sendall(request_bytes)
 
                 response_data = self._receive_full_response()
-                response = json.loads(response_data.decode("utf-8"))
+                # The extension closes every client after one reply
+                self.disconnect()
+                response = loads(response_data)
 
                 if "error" in response:
                     error_msg = response["error"].get("message", "Unknown error")
@@ -153,17 +207,19 @@ class SketchupConnection:
                 BrokenPipeError,
                 ConnectionResetError,
             ) as e:
-                if attempt < max_retries:
-                    logger.warning(
-                        f"Connection error (attempt {attempt + 1}): {str(e)}"
-                    )
+                # Only a reused socket can have gone stale before SketchUp saw
+                # the request. On a fresh one the extension may already have
+                # run it (e.g. it closes without replying when user code raises
+                # a non-StandardError), so resending could repeat side effects.
+                if not reused or attempt >= max_retries:
                     self.disconnect()
-                    if not self.connect():
-                        break
-                else:
-                    self.sock = None
-                    raise Exception(f"Connection lost after {max_retries + 1} attempts")
+                    raise Exception(f"Connection lost: {e}") from e
+                logger.info("Stale connection (%s), reconnecting...", e)
+                self.disconnect()
+                if not self.connect():
+                    break
 
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
             except json.JSONDecodeError as e:
                 raise Exception(f"Invalid response from SketchUp: {str(e)}")
 
@@ -189,24 +245,31 @@ def parse_tool_response(result: Dict[str, Any]) -> Tuple[bool, str]:
     return (False, "No response from SketchUp")
 
 
-# Global connection instance
-_connection: Optional[SketchupConnection] = None
-
+# Pool of connections so concurrent tool calls don't share a socket; with
+# the default size of one it also serializes SketchUp round trips.
+# Connections open lazily, so pre-filling the pool is cheap.
+_connections = [SketchupConnection() for _ in range(config.pool_size)]
+_pool: "queue.LifoQueue[SketchupConnection]" = queue.LifoQueue()
+for _connection in _connections:
+    _pool.put_nowait(_connection)
 
-def get_connection() -> SketchupConnection:
-    """Get or create the global SketchUp connection"""
-    global _connection
 
-    if _connection is None:
-        _connection = SketchupConnection()
+@contextmanager
+def pooled_connection() -> Iterator[SketchupConnection]:
+    """
+    Borrow a SketchUp connection for the duration of a request.
 
-    return _connection
+    Blocks while all pooled connections are in use, which bounds the
+    number of in-flight requests to config.pool_size.
+    """
+    connection = _pool.get()
+    try:
+        yield connection
+    finally:
+        _pool.put_nowait(connection)
 
 
 def close_connection():
-    """Close the global connection"""
-    global _connection
-
-    if _connection:
-        _connection.disconnect()
-        _connection = None
+    """Close all pooled connections"""
+    for connection in _connections:
+        connection.disconnect()
@@ -0,0 +1,40 @@
+"""JSON encoding helpers, using orjson when it is installed."""
+
+import json
+from dataclasses import asdict, is_dataclass
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Encode dataclasses for the stdlib fallback (orjson does this natively)."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize a value to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, default=_default).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    """Serialize a value to a JSON string."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, default=_default)
+
+
+def loads(data: Any) -> Any:
+    """Parse JSON from str, bytes, bytearray or memoryview."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = str(data, "utf-8")
+    return json.loads(data)
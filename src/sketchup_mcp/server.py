@@ -6,12 +6,13 @@ Designed for woodworkers, makers, and beginners using SketchUp Make 2017.
 """
 
 from mcp.server.fastmcp import FastMCP, Context
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from typing import AsyncIterator, Dict, Any, Optional
 
 from . import __version__
-from .connection import get_connection, close_connection
+from .connection import pooled_connection, close_connection
 from .tools import eval_ruby as eval_ruby_tool
 from .tools import describe_model as describe_model_tool
 from .tools import export_scene as export_scene_tool
@@ -28,14 +29,14 @@ logger = logging.getLogger("SketchupMCPServer")
 @asynccontextmanager
 async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
     """Manage server startup and shutdown lifecycle"""
-    logger.info(f"SketchUp MCP Server v{__version__} starting")
+    logger.info("SketchUp MCP Server v%s starting", __version__)
 
     # Try to connect on startup (non-fatal if it fails)
     # Note: connect() is blocking but acceptable for startup.
-    # Consider asyncio.to_thread() if connection latency becomes an issue.
     try:
-        connection = get_connection()
-        if connection.connect():
+        with pooled_connection() as connection:
+            connected = connection.connect()
+        if connected:
             logger.info("Connected to SketchUp on startup")
         else:
             logger.warning(
@@ -43,7 +44,7 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
                 "Make sure SketchUp is running with the MCP extension started."
             )
     except Exception as e:
-        logger.warning(f"SketchUp connection not available: {str(e)}")
+        logger.warning("SketchUp connection not available: %s", e)
 
     yield {}
 
@@ -59,10 +60,13 @@ mcp = FastMCP("SketchupMCP", lifespan=server_lifespan)
 # =============================================================================
 # Tool Definitions
 # =============================================================================
+# Tools that talk to SketchUp run in worker threads so a slow round-trip
+# doesn't block the event loop; each waits for a pooled connection, so
+# calls reach the (serial) extension one at a time.
 
 
 @mcp.tool()
-def eval_ruby(ctx: Context, code: str) -> str:
+async def eval_ruby(ctx: Context, code: str) -> str:
     """
     Execute Ruby code in SketchUp.
 
@@ -80,11 +84,13 @@ def eval_ruby(ctx: Context, code: str) -> str:
         - Create a cube: See resources/recipes.md for code patterns
         - Apply material: "Sketchup.active_model.selection[0].material = 'red'"
     """
-    return eval_ruby_tool.eval_ruby(code, request_id=ctx.request_id)
+    return await asyncio.to_thread(
+        eval_ruby_tool.eval_ruby, code, request_id=ctx.request_id
+    )
 
 
 @mcp.tool()
-def describe_model(ctx: Context, include_details: bool = False) -> str:
+async def describe_model(ctx: Context, include_details: bool = False) -> str:
     """
     Get information about the current SketchUp model.
 
@@ -103,13 +109,15 @@ def describe_model(ctx: Context, include_details: bool = False) -> str:
         - selection: Currently selected items
         - bounds: Model bounding box dimensions
     """
-    return describe_model_tool.describe_model(
-        include_details=include_details, request_id=ctx.request_id
+    return await asyncio.to_thread(
+        describe_model_tool.describe_model,
+        include_details=include_details,
+        request_id=ctx.request_id,
     )
 
 
 @mcp.tool()
-def export_scene(
+async def export_scene(
     ctx: Context,
     export_format: str = "skp",
     width: Optional[int] = None,
@@ -126,7 +134,8 @@ def export_scene(
     Returns:
         JSON with success status and file path
     """
-    return export_scene_tool.export_scene(
+    return await asyncio.to_thread(
+        export_scene_tool.export_scene,
         export_format=export_format,
         width=width,
         height=height,
@@ -135,7 +144,7 @@ def export_scene(
 
 
 @mcp.tool()
-def build_project(
+async def build_project(
     ctx: Context,
     template_type: str,
     width: Optional[float] = None,
@@ -171,7 +180,8 @@ def build_project(
         build_project("bookshelf", width=600, height=1000, depth=300, options={"shelves": 3})
         build_project("box", width=200, height=100, depth=150, options={"has_lid": True})
     """
-    return build_project_tool.build_project(
+    return await asyncio.to_thread(
+        build_project_tool.build_project,
         template_type=template_type,
         width=width,
         height=height,
@@ -200,8 +210,8 @@ def list_templates(ctx: Context) -> str:
 
 
 @mcp.tool()
-def get_cut_list(
-    ctx: Context, region: str = "australia", include_hardware: bool = False
+async def get_cut_list(
+    ctx: Context, region: str = "australia", summary_only: bool = False
 ) -> str:
     """
     Generate a lumber shopping list from the current SketchUp model.
@@ -211,7 +221,7 @@ def get_cut_list(
 
     Args:
         region: Region for lumber sizing - "australia", "north_america", "uk", "europe"
-        include_hardware: Include hardware notes from component names
+        summary_only: Return only total pieces and volume, without the cut_list
 
     Returns:
         JSON with cut_list array, total pieces, and total volume
@@ -226,8 +236,11 @@ def get_cut_list(
             "total_volume": "0.0123 cubic meters"
         }
     """
-    return get_cut_list_tool.get_cut_list(
-        region=region, include_hardware=include_hardware, request_id=ctx.request_id
+    return await asyncio.to_thread(
+        get_cut_list_tool.get_cut_list,
+        region=region,
+        summary_only=summary_only,
+        request_id=ctx.request_id,
     )
 
 
@@ -238,7 +251,7 @@ def get_cut_list(
 
 def main():
     """Run the MCP server"""
-    logger.info(f"Starting SketchUp MCP Server v{__version__}")
+    logger.info("Starting SketchUp MCP Server v%s", __version__)
     mcp.run()
 
 
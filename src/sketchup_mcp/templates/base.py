@@ -1,14 +1,15 @@
 """Base template class for woodworking project templates."""
 
+import functools
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 logger = logging.getLogger("SketchupMCPServer")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LumberPiece:
     """
     Represents a piece of lumber in the cut list.
@@ -29,8 +30,19 @@ class LumberPiece:
     material: str = "pine"
     notes: str = ""
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "width": self.width,
+            "height": self.height,
+            "length": self.length,
+            "quantity": self.quantity,
+            "material": self.material,
+            "notes": self.notes,
+        }
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TemplateResult:
     """Result from template execution."""
 
@@ -43,22 +55,175 @@ class TemplateResult:
         return {
             "success": self.success,
             "ruby_code": self.ruby_code,
-            "cut_list": [
-                {
-                    "name": p.name,
-                    "width": p.width,
-                    "height": p.height,
-                    "length": p.length,
-                    "quantity": p.quantity,
-                    "material": p.material,
-                    "notes": p.notes,
-                }
-                for p in self.cut_list
-            ],
+            "cut_list": [p.to_dict() for p in self.cut_list],
             "error": self.error,
         }
 
 
+# Ruby helpers shared by all generated code; dimensions are passed in mm.
+# Lambdas, since a def would add methods to Object.
+_RUBY_HELPERS = """
+groups_by_name = {}
+
+add_board = lambda do |name, x, y, z, width, depth, height|
+  group = model.active_entities.add_group
+  group.name = name
+  groups_by_name[name] = group
+  pts = [
+    [x.mm, y.mm, z.mm],
+    [(x + width).mm, y.mm, z.mm],
+    [(x + width).mm, (y + depth).mm, z.mm],
+    [x.mm, (y + depth).mm, z.mm]
+  ]
+  face = group.entities.add_face(pts)
+  face.reverse! if face.normal.z < 0
+  face.pushpull(height.mm)
+  group
+end
+
+apply_material = lambda do |name, material, color|
+  # Boards from this script are indexed; only fall back to a model scan
+  group = groups_by_name[name] ||
+    model.active_entities.grep(Sketchup::Group).find { |g| g.name == name }
+  if group
+    mat = model.materials.add(material)
+    mat.color = color
+    group.material = mat
+  end
+end
+"""
+
+
+# Undo-operation scaffold for generated code, with the helpers baked in
+# (their Ruby braces escaped) so only the name and body vary per call.
+# eval_ruby runs code in TOPLEVEL_BINDING, so the script body is wrapped in
+# a lambda to keep its locals (and the Groups they reference) from outliving it.
+_OPERATION_WRAPPER = (
+    """
+lambda do
+model = Sketchup.active_model
+model.start_operation("{op}", true)
+"""
+    + _RUBY_HELPERS.replace("{", "{{").replace("}", "}}")
+    + """
+begin
+{body}
+  model.commit_operation
+  "Created {op} successfully"
+rescue => e
+  model.abort_operation
+  raise e
+end
+end.call
+"""
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_lumber_cached(lumber: str) -> tuple[float, float]:
+    """
+    Parse lumber string like '90x19' into (width, thickness) in mm.
+
+    Cached, since templates are instantiated repeatedly with the same
+    handful of lumber sizes.
+
+    Expects metric dimensions in WIDTHxTHICKNESS format.
+    Does not convert imperial dimensions (e.g., '2x4') - use metric values.
+
+    Args:
+        lumber: Lumber size string (e.g., '90x19', '100x25')
+
+    Returns:
+        Tuple of (width, thickness) in mm
+
+    Raises:
+        ValueError: If lumber format is invalid or dimensions are not positive
+    """
+    if not isinstance(lumber, str):
+        raise ValueError(
+            f"Could not parse lumber '{lumber}'. "
+            f"Expected numeric dimensions like '90x19'."
+        )
+    width_str, sep, thickness_str = lumber.lower().partition("x")
+    if (
+        not sep
+        or not width_str.strip()
+        or not thickness_str.strip()
+        or "x" in thickness_str
+    ):
+        raise ValueError(
+            f"Invalid lumber format '{lumber}'. "
+            f"Expected format: 'WIDTHxTHICKNESS' (e.g., '90x19', '100x25')"
+        )
+    try:
+        width = float(width_str)
+        thickness = float(thickness_str)
+    except ValueError as e:
+        raise ValueError(
+            f"Could not parse lumber '{lumber}'. "
+            f"Expected numeric dimensions like '90x19'. Error: {e}"
+        )
+    if width <= 0 or thickness <= 0:
+        raise ValueError(
+            f"Lumber dimensions must be positive. "
+            f"Got: width={width}, thickness={thickness}"
+        )
+    return width, thickness
+
+
+class _GenerateKey:
+    """Hashable snapshot of a template's parameters, carrying the template."""
+
+    __slots__ = ("template", "_params", "_hash")
+
+    def __init__(self, template: "BaseTemplate"):
+        state = vars(template)
+        options = state.get("options", {})
+        # Types are part of the key so 2 and 2.0 (or 1 and True) don't collide
+        self._params = (
+            type(template),
+            tuple((k, type(v), v) for k, v in state.items() if k != "options"),
+            tuple((k, type(v), v) for k, v in sorted(options.items())),
+        )
+        self._hash = hash(self._params)  # TypeError if a value is unhashable
+        self.template = template
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _GenerateKey) and self._params == other._params
+
+
+def memoize_generate(
+    generate: Callable[["BaseTemplate"], TemplateResult],
+) -> Callable[["BaseTemplate"], TemplateResult]:
+    """
+    Cache a template's generate() results by constructor parameters.
+
+    Templates are pure functions of the attributes set in __init__, so
+    identical parameters share one TemplateResult; callers must treat it
+    (and its cut_list) as read-only. Templates with unhashable options are
+    generated uncached. The wrapper exposes cache_info() and cache_clear().
+    """
+
+    @functools.lru_cache(maxsize=256)
+    def cached(key: _GenerateKey) -> TemplateResult:
+        return generate(key.template)
+
+    @functools.wraps(generate)
+    def wrapper(self: "BaseTemplate") -> TemplateResult:
+        try:
+            key = _GenerateKey(self)
+        except TypeError:
+            return generate(self)
+        return cached(key)
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
 class BaseTemplate(ABC):
     """Abstract base class for project templates."""
 
@@ -94,6 +259,8 @@ class BaseTemplate(ABC):
         self.width = float(width)
         self.height = float(height)
         self.depth = float(depth)
+        # "WxHxD" in whole mm, used in undo-operation names
+        self._dim_label = f"{int(self.width)}x{int(self.height)}x{int(self.depth)}"
         self.lumber = lumber
         self.joinery = joinery or self.default_joinery
         self.material = material
@@ -104,47 +271,8 @@ class BaseTemplate(ABC):
         self.lumber_width, self.lumber_thickness = self._parse_lumber(lumber)
 
     def _parse_lumber(self, lumber: str) -> tuple[float, float]:
-        """
-        Parse lumber string like '90x19' into (width, thickness) in mm.
-
-        Expects metric dimensions in WIDTHxTHICKNESS format.
-        Does not convert imperial dimensions (e.g., '2x4') - use metric values.
-
-        Args:
-            lumber: Lumber size string (e.g., '90x19', '100x25')
-
-        Returns:
-            Tuple of (width, thickness) in mm
-
-        Raises:
-            ValueError: If lumber format is invalid or dimensions are not positive
-        """
-        try:
-            parts = lumber.lower().replace("x", " ").split()
-            if len(parts) != 2:
-                raise ValueError(
-                    f"Invalid lumber format '{lumber}'. "
-                    f"Expected format: 'WIDTHxTHICKNESS' (e.g., '90x19', '100x25')"
-                )
-            width = float(parts[0])
-            thickness = float(parts[1])
-            if width <= 0 or thickness <= 0:
-                raise ValueError(
-                    f"Lumber dimensions must be positive. "
-                    f"Got: width={width}, thickness={thickness}"
-                )
-            return width, thickness
-        except ValueError:
-            raise
-        except Exception as e:
-            raise ValueError(
-                f"Could not parse lumber '{lumber}'. "
-                f"Expected numeric dimensions like '90x19'. Error: {e}"
-            )
-
-    def _mm(self, value: float) -> str:
-        """Format value as Ruby mm unit."""
-        return f"{value}.mm"
+        """Parse lumber string like '90x19' into (width, thickness) in mm."""
+        return _parse_lumber_cached(lumber)
 
     def _create_board_ruby(
         self,
@@ -157,51 +285,15 @@ class BaseTemplate(ABC):
         z: float = 0,
     ) -> str:
         """Generate Ruby code to create a board as a component."""
-        return f'''
-# Create {name}
-group = model.active_entities.add_group
-group.name = "{name}"
-entities = group.entities
-
-# Create face and extrude
-pts = [
-  [{self._mm(x)}, {self._mm(y)}, {self._mm(z)}],
-  [{self._mm(x + width)}, {self._mm(y)}, {self._mm(z)}],
-  [{self._mm(x + width)}, {self._mm(y + depth)}, {self._mm(z)}],
-  [{self._mm(x)}, {self._mm(y + depth)}, {self._mm(z)}]
-]
-face = entities.add_face(pts)
-face.reverse! if face.normal.z < 0
-face.pushpull({self._mm(height)})
-'''
+        return f'add_board.call("{name}", {x}, {y}, {z}, {width}, {depth}, {height})'
 
     def _apply_material_ruby(self, group_name: str, color: str) -> str:
         """Generate Ruby code to apply material to a group."""
-        return f'''
-# Apply material to {group_name}
-{group_name.lower().replace(" ", "_")}_group = model.active_entities.grep(Sketchup::Group).find {{ |g| g.name == "{group_name}" }}
-if {group_name.lower().replace(" ", "_")}_group
-  mat = model.materials.add("{self.material}")
-  mat.color = "{color}"
-  {group_name.lower().replace(" ", "_")}_group.material = mat
-end
-'''
+        return f'apply_material.call("{group_name}", "{self.material}", "{color}")'
 
     def _wrap_in_operation(self, ruby_code: str, operation_name: str) -> str:
         """Wrap Ruby code in an undo operation."""
-        return f'''
-model = Sketchup.active_model
-model.start_operation("{operation_name}", true)
-
-begin
-{ruby_code}
-  model.commit_operation
-  "Created {operation_name} successfully"
-rescue => e
-  model.abort_operation
-  raise e
-end
-'''
+        return _OPERATION_WRAPPER.format(op=operation_name, body=ruby_code)
 
     @abstractmethod
     def generate(self) -> TemplateResult:
@@ -214,8 +306,9 @@ end
         pass
 
     @classmethod
+    @functools.cache
     def get_template_info(cls) -> Dict[str, Any]:
-        """Return template metadata for discovery."""
+        """Return template metadata for discovery (cached per class; don't mutate)."""
         return {
             "name": cls.template_name,
             "description": cls.description,
@@ -3,7 +3,7 @@
 import logging
 from typing import Optional
 
-from .base import BaseTemplate, TemplateResult, LumberPiece
+from .base import BaseTemplate, TemplateResult, LumberPiece, memoize_generate
 
 logger = logging.getLogger("SketchupMCPServer")
 
@@ -52,9 +52,14 @@ class BookshelfTemplate(BaseTemplate):
         )
         self.shelves = max(1, int(shelves))
 
+    @memoize_generate
     def generate(self) -> TemplateResult:
         """Generate bookshelf Ruby code and cut list."""
         try:
+            # Bind instance attributes used throughout to locals
+            height, depth = self.height, self.depth
+            lumber_width, material = self.lumber_width, self.material
+
             # Calculate dimensions
             side_thickness = self.lumber_thickness
             shelf_thickness = self.lumber_thickness
@@ -67,7 +72,7 @@ class BookshelfTemplate(BaseTemplate):
             top_bottom_thickness = (
                 2 * shelf_thickness
             )  # Account for top and bottom panels
-            available_height = self.height - total_shelf_height - top_bottom_thickness
+            available_height = height - total_shelf_height - top_bottom_thickness
 
             # Validate dimensions
             if available_height <= 0:
@@ -76,7 +81,7 @@ class BookshelfTemplate(BaseTemplate):
                 )
                 return TemplateResult(
                     success=False,
-                    error=f"Height {self.height}mm is too small for {self.shelves} shelves with {shelf_thickness}mm lumber. "
+                    error=f"Height {height}mm is too small for {self.shelves} shelves with {shelf_thickness}mm lumber. "
                     f"Minimum height required: {min_height}mm",
                 )
 
@@ -86,126 +91,102 @@ class BookshelfTemplate(BaseTemplate):
             cut_list = [
                 LumberPiece(
                     name="Side Panel",
-                    width=self.lumber_width,
-                    height=self.height,
-                    length=self.depth,
+                    width=lumber_width,
+                    height=height,
+                    length=depth,
                     quantity=2,
-                    material=self.material,
+                    material=material,
                     notes="Left and right sides",
                 ),
                 LumberPiece(
                     name="Shelf",
-                    width=self.lumber_width,
+                    width=lumber_width,
                     height=interior_width,
-                    length=self.depth,
+                    length=depth,
                     quantity=self.shelves,
-                    material=self.material,
+                    material=material,
                     notes=f"Fixed shelves, {self.joinery} joints",
                 ),
                 LumberPiece(
                     name="Top Panel",
-                    width=self.lumber_width,
+                    width=lumber_width,
                     height=interior_width,
-                    length=self.depth,
+                    length=depth,
                     quantity=1,
-                    material=self.material,
+                    material=material,
                     notes="Top of bookshelf",
                 ),
                 LumberPiece(
                     name="Bottom Panel",
-                    width=self.lumber_width,
+                    width=lumber_width,
                     height=interior_width,
-                    length=self.depth,
+                    length=depth,
                     quantity=1,
-                    material=self.material,
+                    material=material,
                     notes="Bottom of bookshelf",
                 ),
             ]
 
             # Generate Ruby code
-            ruby_parts = []
-
-            # Left side
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Left Side",
-                    width=side_thickness,
-                    height=self.height,
-                    depth=self.depth,
-                    x=0,
-                    y=0,
-                    z=0,
-                )
-            )
-
-            # Right side
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Right Side",
-                    width=side_thickness,
-                    height=self.height,
-                    depth=self.depth,
-                    x=self.width - side_thickness,
-                    y=0,
-                    z=0,
-                )
-            )
-
-            # Top
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Top",
-                    width=interior_width,
-                    height=shelf_thickness,
-                    depth=self.depth,
-                    x=side_thickness,
-                    y=0,
-                    z=self.height - shelf_thickness,
-                )
-            )
-
-            # Bottom
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Bottom",
-                    width=interior_width,
-                    height=shelf_thickness,
-                    depth=self.depth,
-                    x=side_thickness,
-                    y=0,
-                    z=0,
-                )
-            )
+            # (name, width, height, depth, x, y, z) per board
+            board_specs = [
+                ("Left Side", side_thickness, height, depth, 0, 0, 0),
+                (
+                    "Right Side",
+                    side_thickness,
+                    height,
+                    depth,
+                    self.width - side_thickness,
+                    0,
+                    0,
+                ),
+                (
+                    "Top",
+                    interior_width,
+                    shelf_thickness,
+                    depth,
+                    side_thickness,
+                    0,
+                    height - shelf_thickness,
+                ),
+                (
+                    "Bottom",
+                    interior_width,
+                    shelf_thickness,
+                    depth,
+                    side_thickness,
+                    0,
+                    0,
+                ),
+            ]
 
             # Shelves - position above bottom panel
-            for i in range(self.shelves):
-                shelf_z = (
-                    shelf_thickness + (i + 1) * shelf_spacing + (i * shelf_thickness)
-                )
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name=f"Shelf {i + 1}",
-                        width=interior_width,
-                        height=shelf_thickness,
-                        depth=self.depth,
-                        x=side_thickness,
-                        y=0,
-                        z=shelf_z,
-                    )
+            board_specs += [
+                (
+                    f"Shelf {i + 1}",
+                    interior_width,
+                    shelf_thickness,
+                    depth,
+                    side_thickness,
+                    0,
+                    shelf_thickness + (i + 1) * shelf_spacing + (i * shelf_thickness),
                 )
+                for i in range(self.shelves)
+            ]
 
             # Combine and wrap
-            ruby_code = "\n".join(ruby_parts)
+            make_board = self._create_board_ruby
+            ruby_code = "\n".join(make_board(*spec) for spec in board_specs)
             ruby_code = self._wrap_in_operation(
                 ruby_code,
-                f"Bookshelf {int(self.width)}x{int(self.height)}x{int(self.depth)}",
+                f"Bookshelf {self._dim_label}",
             )
 
             return TemplateResult(success=True, ruby_code=ruby_code, cut_list=cut_list)
 
         except ValueError as e:
-            logger.warning(f"Bookshelf template validation error: {e}")
+            logger.warning("Bookshelf template validation error: %s", e)
             return TemplateResult(success=False, error=str(e))
         except Exception as e:
-            logger.exception(f"Bookshelf template unexpected error: {e}")
+            logger.exception("Bookshelf template unexpected error: %s", e)
             raise
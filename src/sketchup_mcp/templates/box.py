@@ -3,7 +3,7 @@
 import logging
 from typing import Optional
 
-from .base import BaseTemplate, TemplateResult, LumberPiece
+from .base import BaseTemplate, TemplateResult, LumberPiece, memoize_generate
 
 logger = logging.getLogger("SketchupMCPServer")
 
@@ -52,38 +52,44 @@ class BoxTemplate(BaseTemplate):
         )
         self.has_lid = has_lid
 
+    @memoize_generate
     def generate(self) -> TemplateResult:
         """Generate box Ruby code and cut list."""
         try:
+            # Bind instance attributes used throughout to locals
+            width, height, depth = self.width, self.height, self.depth
+            lumber_width, material = self.lumber_width, self.material
+            has_lid = self.has_lid
+
             # Use parsed lumber dimensions
             wall_thickness = self.lumber_thickness
             bottom_thickness = self.lumber_thickness
 
             # Interior dimensions
-            interior_width = self.width - (2 * wall_thickness)
-            interior_depth = self.depth - (2 * wall_thickness)
-            box_height = self.height - bottom_thickness
-            if self.has_lid:
+            interior_width = width - (2 * wall_thickness)
+            interior_depth = depth - (2 * wall_thickness)
+            box_height = height - bottom_thickness
+            if has_lid:
                 box_height -= wall_thickness  # Account for lid
 
             # Validate dimensions
             if box_height <= 0:
                 min_height = (
                     bottom_thickness + wall_thickness + 1
-                    if self.has_lid
+                    if has_lid
                     else bottom_thickness + 1
                 )
                 return TemplateResult(
                     success=False,
-                    error=f"Height {self.height}mm is too small for a box with {wall_thickness}mm lumber"
-                    f"{' and lid' if self.has_lid else ''}. Minimum height required: {min_height}mm",
+                    error=f"Height {height}mm is too small for a box with {wall_thickness}mm lumber"
+                    f"{' and lid' if has_lid else ''}. Minimum height required: {min_height}mm",
                 )
 
             if interior_width <= 0 or interior_depth <= 0:
                 min_dim = (2 * wall_thickness) + 1
                 return TemplateResult(
                     success=False,
-                    error=f"Width ({self.width}mm) or depth ({self.depth}mm) is too small for {wall_thickness}mm lumber. "
+                    error=f"Width ({width}mm) or depth ({depth}mm) is too small for {wall_thickness}mm lumber. "
                     f"Minimum required: {min_dim}mm",
                 )
 
@@ -91,140 +97,113 @@ class BoxTemplate(BaseTemplate):
             cut_list = [
                 LumberPiece(
                     name="Front/Back Panel",
-                    width=self.lumber_width,
-                    height=self.width,
+                    width=lumber_width,
+                    height=width,
                     length=box_height,
                     quantity=2,
-                    material=self.material,
+                    material=material,
                     notes=f"Front and back, {self.joinery}",
                 ),
                 LumberPiece(
                     name="Side Panel",
-                    width=self.lumber_width,
+                    width=lumber_width,
                     height=interior_depth,
                     length=box_height,
                     quantity=2,
-                    material=self.material,
+                    material=material,
                     notes=f"Left and right sides, {self.joinery}",
                 ),
                 LumberPiece(
                     name="Bottom",
-                    width=self.lumber_width,
+                    width=lumber_width,
                     height=interior_width,
                     length=interior_depth,
                     quantity=1,
-                    material=self.material,
+                    material=material,
                     notes="Bottom panel, sized to fit inside walls",
                 ),
             ]
 
-            if self.has_lid:
+            if has_lid:
                 cut_list.append(
                     LumberPiece(
                         name="Lid",
-                        width=self.lumber_width,
-                        height=self.width + 10,  # Slight overhang
-                        length=self.depth + 10,
+                        width=lumber_width,
+                        height=width + 10,  # Slight overhang
+                        length=depth + 10,
                         quantity=1,
-                        material=self.material,
+                        material=material,
                         notes="Lid with slight overhang",
                     )
                 )
 
             # Generate Ruby code
-            ruby_parts = []
-
-            # Front panel
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Front",
-                    width=self.width,
-                    height=box_height,
-                    depth=wall_thickness,
-                    x=0,
-                    y=0,
-                    z=bottom_thickness,
-                )
-            )
-
-            # Back panel
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Back",
-                    width=self.width,
-                    height=box_height,
-                    depth=wall_thickness,
-                    x=0,
-                    y=self.depth - wall_thickness,
-                    z=bottom_thickness,
-                )
-            )
-
-            # Left side
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Left Side",
-                    width=wall_thickness,
-                    height=box_height,
-                    depth=interior_depth,
-                    x=0,
-                    y=wall_thickness,
-                    z=bottom_thickness,
-                )
-            )
-
-            # Right side
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Right Side",
-                    width=wall_thickness,
-                    height=box_height,
-                    depth=interior_depth,
-                    x=self.width - wall_thickness,
-                    y=wall_thickness,
-                    z=bottom_thickness,
-                )
-            )
-
-            # Bottom
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Bottom",
-                    width=interior_width,
-                    height=bottom_thickness,
-                    depth=interior_depth,
-                    x=wall_thickness,
-                    y=wall_thickness,
-                    z=0,
-                )
-            )
+            # (name, width, height, depth, x, y, z) per board
+            board_specs = [
+                (
+                    "Front",
+                    width,
+                    box_height,
+                    wall_thickness,
+                    0,
+                    0,
+                    bottom_thickness,
+                ),
+                (
+                    "Back",
+                    width,
+                    box_height,
+                    wall_thickness,
+                    0,
+                    depth - wall_thickness,
+                    bottom_thickness,
+                ),
+                (
+                    "Left Side",
+                    wall_thickness,
+                    box_height,
+                    interior_depth,
+                    0,
+                    wall_thickness,
+                    bottom_thickness,
+                ),
+                (
+                    "Right Side",
+                    wall_thickness,
+                    box_height,
+                    interior_depth,
+                    width - wall_thickness,
+                    wall_thickness,
+                    bottom_thickness,
+                ),
+                (
+                    "Bottom",
+                    interior_width,
+                    bottom_thickness,
+                    interior_depth,
+                    wall_thickness,
+                    wall_thickness,
+                    0,
+                ),
+            ]
 
             # Lid (offset slightly above)
-            if self.has_lid:
+            if has_lid:
                 lid_z = bottom_thickness + box_height + 20  # 20mm gap for visibility
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name="Lid",
-                        width=self.width + 10,
-                        height=wall_thickness,
-                        depth=self.depth + 10,
-                        x=-5,
-                        y=-5,
-                        z=lid_z,
-                    )
+                board_specs.append(
+                    ("Lid", width + 10, wall_thickness, depth + 10, -5, -5, lid_z)
                 )
 
             # Combine and wrap
-            ruby_code = "\n".join(ruby_parts)
-            ruby_code = self._wrap_in_operation(
-                ruby_code, f"Box {int(self.width)}x{int(self.height)}x{int(self.depth)}"
-            )
+            make_board = self._create_board_ruby
+            ruby_code = "\n".join(make_board(*spec) for spec in board_specs)
+            ruby_code = self._wrap_in_operation(ruby_code, f"Box {self._dim_label}")
 
             return TemplateResult(success=True, ruby_code=ruby_code, cut_list=cut_list)
 
         except ValueError as e:
-            logger.warning(f"Box template validation error: {e}")
+            logger.warning("Box template validation error: %s", e)
             return TemplateResult(success=False, error=str(e))
         except Exception as e:
-            logger.exception(f"Box template unexpected error: {e}")
+            logger.exception("Box template unexpected error: %s", e)
             raise
@@ -3,7 +3,7 @@
 import logging
 from typing import Optional
 
-from .base import BaseTemplate, TemplateResult, LumberPiece
+from .base import BaseTemplate, TemplateResult, LumberPiece, memoize_generate
 
 logger = logging.getLogger("SketchupMCPServer")
 
@@ -64,248 +64,237 @@ class CabinetTemplate(BaseTemplate):
         self.has_base = has_base
         self.base_height = base_height
 
+    @memoize_generate
     def generate(self) -> TemplateResult:
         """Generate cabinet Ruby code and cut list."""
         try:
+            # Bind instance attributes used throughout to locals
+            width, height, depth = self.width, self.height, self.depth
+            lumber_width, material = self.lumber_width, self.material
+            joinery = self.joinery
+            has_base, base_height = self.has_base, self.base_height
+            shelf_count = self.shelf_count
+            has_doors, door_count = self.has_doors, self.door_count
+
             # Calculate dimensions
             panel_thickness = self.lumber_thickness
             door_thickness = self.lumber_thickness
 
             # Carcass dimensions
-            carcass_height = self.height - (self.base_height if self.has_base else 0)
-            interior_width = self.width - (2 * panel_thickness)
-            interior_depth = self.depth - panel_thickness  # Back panel inset
+            carcass_height = height - (base_height if has_base else 0)
+            interior_width = width - (2 * panel_thickness)
+            interior_depth = depth - panel_thickness  # Back panel inset
 
             # Validate dimensions
             if interior_width <= 0:
                 return TemplateResult(
                     success=False,
-                    error=f"Cabinet width {self.width}mm too small for {panel_thickness}mm panels. "
+                    error=f"Cabinet width {width}mm too small for {panel_thickness}mm panels. "
                     f"Minimum: {2 * panel_thickness + 50}mm",
                 )
 
             if carcass_height <= panel_thickness * 2:
                 return TemplateResult(
                     success=False,
-                    error=f"Cabinet height {self.height}mm too small with {self.base_height}mm base. "
-                    f"Minimum: {self.base_height + panel_thickness * 3}mm",
+                    error=f"Cabinet height {height}mm too small with {base_height}mm base. "
+                    f"Minimum: {base_height + panel_thickness * 3}mm",
                 )
 
             # Shelf spacing
             available_height = carcass_height - (2 * panel_thickness)
-            if self.shelf_count > 0:
-                shelf_spacing = available_height / (self.shelf_count + 1)
+            if shelf_count > 0:
+                shelf_spacing = available_height / (shelf_count + 1)
             else:
                 shelf_spacing = available_height
 
             # Door dimensions (overlay style)
-            door_width = (
-                self.width / self.door_count if self.door_count > 1 else self.width
-            )
+            door_width = width / door_count if door_count > 1 else width
             door_height = carcass_height
 
             # Build cut list
             cut_list = [
                 LumberPiece(
                     name="Side Panel",
-                    width=self.lumber_width,
+                    width=lumber_width,
                     height=carcass_height,
-                    length=self.depth,
+                    length=depth,
                     quantity=2,
-                    material=self.material,
-                    notes=f"Left and right sides, {self.joinery} for shelves",
+                    material=material,
+                    notes=f"Left and right sides, {joinery} for shelves",
                 ),
                 LumberPiece(
                     name="Top Panel",
-                    width=self.lumber_width,
+                    width=lumber_width,
                     height=interior_width,
-                    length=self.depth,
+                    length=depth,
                     quantity=1,
-                    material=self.material,
+                    material=material,
                     notes="Top of carcass",
                 ),
                 LumberPiece(
                     name="Bottom Panel",
-                    width=self.lumber_width,
+                    width=lumber_width,
                     height=interior_width,
-                    length=self.depth,
+                    length=depth,
                     quantity=1,
-                    material=self.material,
+                    material=material,
                     notes="Bottom of carcass",
                 ),
                 LumberPiece(
                     name="Back Panel",
-                    width=self.lumber_width,
+                    width=lumber_width,
                     height=interior_width,
-                    length=carcass_height - (2 * panel_thickness),
+                    length=available_height,
                     quantity=1,
-                    material=self.material,
+                    material=material,
                     notes="Back panel, rabbeted into sides",
                 ),
             ]
 
-            if self.shelf_count > 0:
+            if shelf_count > 0:
                 cut_list.append(
                     LumberPiece(
                         name="Shelf",
-                        width=self.lumber_width,
+                        width=lumber_width,
                         height=interior_width,
                         length=interior_depth - 10,  # Slight inset from front
-                        quantity=self.shelf_count,
-                        material=self.material,
-                        notes=f"Adjustable shelves, {self.joinery}",
+                        quantity=shelf_count,
+                        material=material,
+                        notes=f"Adjustable shelves, {joinery}",
                     )
                 )
 
-            if self.has_base:
+            if has_base:
                 cut_list.append(
                     LumberPiece(
                         name="Base/Toe Kick",
-                        width=self.lumber_width,
-                        height=self.width - (2 * panel_thickness),
-                        length=self.base_height,
+                        width=lumber_width,
+                        height=interior_width,
+                        length=base_height,
                         quantity=1,
-                        material=self.material,
+                        material=material,
                         notes="Toe kick, recessed 50mm from front",
                     )
                 )
 
-            if self.has_doors:
+            if has_doors:
                 cut_list.append(
                     LumberPiece(
                         name="Door",
-                        width=self.lumber_width,
+                        width=lumber_width,
                         height=door_width - 3,  # 3mm gap between doors
                         length=door_height - 3,
-                        quantity=self.door_count,
-                        material=self.material,
+                        quantity=door_count,
+                        material=material,
                         notes="Overlay doors with hinges",
                     )
                 )
 
             # Generate Ruby code
-            ruby_parts = []
-
             # Base Z offset
-            base_z = self.base_height if self.has_base else 0
-
-            # Left side
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Left Side",
-                    width=panel_thickness,
-                    height=carcass_height,
-                    depth=self.depth,
-                    x=0,
-                    y=0,
-                    z=base_z,
-                )
-            )
-
-            # Right side
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Right Side",
-                    width=panel_thickness,
-                    height=carcass_height,
-                    depth=self.depth,
-                    x=self.width - panel_thickness,
-                    y=0,
-                    z=base_z,
-                )
-            )
-
-            # Top
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Top",
-                    width=interior_width,
-                    height=panel_thickness,
-                    depth=self.depth,
-                    x=panel_thickness,
-                    y=0,
-                    z=base_z + carcass_height - panel_thickness,
-                )
-            )
+            base_z = base_height if has_base else 0
+            shelf_base_z = base_z + panel_thickness  # Top of the bottom panel
 
-            # Bottom
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Bottom",
-                    width=interior_width,
-                    height=panel_thickness,
-                    depth=self.depth,
-                    x=panel_thickness,
-                    y=0,
-                    z=base_z,
-                )
-            )
-
-            # Back panel (inset from back edge)
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Back Panel",
-                    width=interior_width,
-                    height=carcass_height - (2 * panel_thickness),
-                    depth=panel_thickness,
-                    x=panel_thickness,
-                    y=self.depth - panel_thickness,
-                    z=base_z + panel_thickness,
-                )
-            )
+            # (name, width, height, depth, x, y, z) per board
+            board_specs = [
+                (
+                    "Left Side",
+                    panel_thickness,
+                    carcass_height,
+                    depth,
+                    0,
+                    0,
+                    base_z,
+                ),
+                (
+                    "Right Side",
+                    panel_thickness,
+                    carcass_height,
+                    depth,
+                    width - panel_thickness,
+                    0,
+                    base_z,
+                ),
+                (
+                    "Top",
+                    interior_width,
+                    panel_thickness,
+                    depth,
+                    panel_thickness,
+                    0,
+                    base_z + carcass_height - panel_thickness,
+                ),
+                (
+                    "Bottom",
+                    interior_width,
+                    panel_thickness,
+                    depth,
+                    panel_thickness,
+                    0,
+                    base_z,
+                ),
+                # Back panel (inset from back edge)
+                (
+                    "Back Panel",
+                    interior_width,
+                    available_height,
+                    panel_thickness,
+                    panel_thickness,
+                    depth - panel_thickness,
+                    shelf_base_z,
+                ),
+            ]
 
             # Shelves
-            for i in range(self.shelf_count):
-                shelf_z = base_z + panel_thickness + (i + 1) * shelf_spacing
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name=f"Shelf {i + 1}",
-                        width=interior_width,
-                        height=panel_thickness,
-                        depth=interior_depth - 10,
-                        x=panel_thickness,
-                        y=0,
-                        z=shelf_z,
-                    )
+            board_specs += [
+                (
+                    f"Shelf {i + 1}",
+                    interior_width,
+                    panel_thickness,
+                    interior_depth - 10,
+                    panel_thickness,
+                    0,
+                    shelf_base_z + (i + 1) * shelf_spacing,
                 )
+                for i in range(shelf_count)
+            ]
 
             # Base/toe kick (recessed 50mm from front)
-            if self.has_base:
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name="Toe Kick",
-                        width=self.width - (2 * panel_thickness),
-                        height=self.base_height,
-                        depth=panel_thickness,
-                        x=panel_thickness,
-                        y=50,
-                        z=0,
+            if has_base:
+                board_specs.append(
+                    (
+                        "Toe Kick",
+                        interior_width,
+                        base_height,
+                        panel_thickness,
+                        panel_thickness,
+                        50,
+                        0,
                     )
                 )
 
             # Doors (offset slightly in front for visibility)
-            if self.has_doors:
+            if has_doors:
                 door_gap = 3
-                for i in range(self.door_count):
-                    door_x = i * door_width + (door_gap / 2)
-                    actual_door_width = door_width - door_gap
-                    ruby_parts.append(
-                        self._create_board_ruby(
-                            name=f"Door {i + 1}",
-                            width=actual_door_width,
-                            height=door_height - door_gap,
-                            depth=door_thickness,
-                            x=door_x,
-                            y=-20,  # Offset in front for visibility
-                            z=base_z + (door_gap / 2),
-                        )
+                board_specs += [
+                    (
+                        f"Door {i + 1}",
+                        door_width - door_gap,
+                        door_height - door_gap,
+                        door_thickness,
+                        i * door_width + (door_gap / 2),
+                        -20,  # Offset in front for visibility
+                        base_z + (door_gap / 2),
                     )
+                    for i in range(door_count)
+                ]
 
             # Combine and wrap
-            ruby_code = "\n".join(ruby_parts)
+            make_board = self._create_board_ruby
+            ruby_code = "\n".join(make_board(*spec) for spec in board_specs)
             ruby_code = self._wrap_in_operation(
                 ruby_code,
-                f"Cabinet {int(self.width)}x{int(self.height)}x{int(self.depth)}",
+                f"Cabinet {self._dim_label}",
             )
 
             return TemplateResult(success=True, ruby_code=ruby_code, cut_list=cut_list)
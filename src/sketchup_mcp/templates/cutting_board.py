@@ -3,7 +3,7 @@
 import logging
 from typing import Optional, Literal
 
-from .base import BaseTemplate, TemplateResult, LumberPiece
+from .base import BaseTemplate, TemplateResult, LumberPiece, memoize_generate
 
 logger = logging.getLogger("SketchupMCPServer")
 
@@ -54,7 +54,13 @@ class CuttingBoardTemplate(BaseTemplate):
         )
         self.pattern = pattern
         self.stripe_count = max(1, int(stripe_count))
+        # Undo-operation name, fixed once the dimensions are
+        pattern_name = pattern.replace("_", " ").title()
+        self._operation_name = (
+            f"{pattern_name} Cutting Board {int(self.width)}x{int(self.depth)}"
+        )
 
+    @memoize_generate
     def generate(self) -> TemplateResult:
         """Generate cutting board Ruby code and cut list."""
         try:
@@ -108,28 +114,12 @@ class CuttingBoardTemplate(BaseTemplate):
 
             # Generate Ruby code - single solid board visualization
             # (The stripes are construction detail, final product is one piece)
-            ruby_parts = []
-
-            # Main board
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Cutting Board",
-                    width=self.width,
-                    height=board_thickness,
-                    depth=self.depth,
-                    x=0,
-                    y=0,
-                    z=0,
-                )
+            ruby_code = self._create_board_ruby(
+                "Cutting Board", self.width, board_thickness, self.depth
             )
 
-            # Combine and wrap
-            ruby_code = "\n".join(ruby_parts)
-            pattern_name = self.pattern.replace("_", " ").title()
-            ruby_code = self._wrap_in_operation(
-                ruby_code,
-                f"{pattern_name} Cutting Board {int(self.width)}x{int(self.depth)}",
-            )
+            # Wrap in an undo operation
+            ruby_code = self._wrap_in_operation(ruby_code, self._operation_name)
 
             return TemplateResult(success=True, ruby_code=ruby_code, cut_list=cut_list)
 
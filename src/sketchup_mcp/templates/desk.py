@@ -3,7 +3,7 @@
 import logging
 from typing import Optional, Literal
 
-from .base import BaseTemplate, TemplateResult, LumberPiece
+from .base import BaseTemplate, TemplateResult, LumberPiece, memoize_generate
 
 logger = logging.getLogger("SketchupMCPServer")
 
@@ -61,68 +61,78 @@ class DeskTemplate(BaseTemplate):
         self.has_keyboard_tray = has_keyboard_tray
         self.has_back_panel = has_back_panel
 
+    @memoize_generate
     def generate(self) -> TemplateResult:
         """Generate desk Ruby code and cut list."""
         try:
+            # Bind instance attributes used throughout to locals
+            width, height, depth = self.width, self.height, self.depth
+            lumber_width, material = self.lumber_width, self.material
+            has_drawer, drawer_side = self.has_drawer, self.drawer_side
+            has_keyboard_tray = self.has_keyboard_tray
+            has_back_panel = self.has_back_panel
+
             # Calculate dimensions
             panel_thickness = self.lumber_thickness
             desktop_thickness = self.lumber_thickness
 
             # Leg panel dimensions
-            leg_panel_height = self.height - desktop_thickness
-            leg_panel_depth = self.depth - 50  # Inset from front
+            leg_panel_height = height - desktop_thickness
+            leg_panel_depth = depth - 50  # Inset from front
 
             # Drawer unit dimensions
             drawer_unit_width = 400
             drawer_height = 150
 
             # Validate dimensions
-            if self.width < 600:
+            if width < 600:
                 return TemplateResult(
                     success=False,
-                    error=f"Desk width {self.width}mm too small. Minimum: 600mm",
+                    error=f"Desk width {width}mm too small. Minimum: 600mm",
                 )
 
             if leg_panel_height < 400:
                 return TemplateResult(
                     success=False,
-                    error=f"Desk height {self.height}mm too small. Minimum: {desktop_thickness + 400}mm",
+                    error=f"Desk height {height}mm too small. Minimum: {desktop_thickness + 400}mm",
                 )
 
             # Calculate knee space (between leg panels)
-            left_drawer = self.has_drawer and self.drawer_side in ["left", "both"]
-            right_drawer = self.has_drawer and self.drawer_side in ["right", "both"]
+            left_drawer = has_drawer and drawer_side in ["left", "both"]
+            right_drawer = has_drawer and drawer_side in ["right", "both"]
 
             left_panel_x = 0
-            right_panel_x = self.width - panel_thickness
+            right_panel_x = width - panel_thickness
+            rail_length = width - (2 * panel_thickness)  # Between leg panels
+            leg_panel_y = depth - leg_panel_depth
 
             # Build cut list
             cut_list = [
                 LumberPiece(
                     name="Desktop",
-                    width=self.lumber_width,
-                    height=self.width,
-                    length=self.depth,
+                    width=lumber_width,
+                    height=width,
+                    length=depth,
                     quantity=1,
-                    material=self.material,
+                    material=material,
                     notes="Solid or glued-up panel",
                 ),
                 LumberPiece(
                     name="Leg Panel",
-                    width=self.lumber_width,
+                    width=lumber_width,
                     height=leg_panel_depth,
                     length=leg_panel_height,
                     quantity=2,
-                    material=self.material,
+                    material=material,
                     notes="Left and right leg panels",
                 ),
                 LumberPiece(
                     name="Back Rail",
-                    width=self.lumber_width,
-                    height=self.lumber_width,
-                    length=self.width - (2 * panel_thickness),
+                    width=lumber_width,
+                    height=lumber_width,
+                    length=rail_length,
                     quantity=1,
-                    material=self.material,
+                    material=material,
                     notes="Connects leg panels at back",
                 ),
             ]
@@ -134,189 +144,177 @@ class DeskTemplate(BaseTemplate):
                     [
                         LumberPiece(
                             name="Drawer Front",
-                            width=self.lumber_width,
+                            width=lumber_width,
                             height=drawer_unit_width - 20,
                             length=drawer_height - 10,
                             quantity=drawer_count,
-                            material=self.material,
+                            material=material,
                             notes="Drawer face",
                         ),
                         LumberPiece(
                             name="Drawer Side",
-                            width=self.lumber_width,
+                            width=lumber_width,
                             height=leg_panel_depth - 50,
                             length=drawer_height - 30,
                             quantity=drawer_count * 2,
-                            material=self.material,
+                            material=material,
                             notes="Left and right drawer sides",
                         ),
                         LumberPiece(
                             name="Drawer Back",
-                            width=self.lumber_width,
+                            width=lumber_width,
                             height=drawer_unit_width - 60,
                             length=drawer_height - 30,
                             quantity=drawer_count,
-                            material=self.material,
+                            material=material,
                             notes="Drawer back panel",
                         ),
                         LumberPiece(
                             name="Drawer Bottom",
-                            width=self.lumber_width,
+                            width=lumber_width,
                             height=drawer_unit_width - 60,
                             length=leg_panel_depth - 70,
                             quantity=drawer_count,
-                            material=self.material,
+                            material=material,
                             notes="Drawer bottom (plywood recommended)",
                         ),
                     ]
                 )
 
-            if self.has_keyboard_tray:
+            if has_keyboard_tray:
                 cut_list.append(
                     LumberPiece(
                         name="Keyboard Tray",
-                        width=self.lumber_width,
+                        width=lumber_width,
                         height=600,
                         length=300,
                         quantity=1,
-                        material=self.material,
+                        material=material,
                         notes="Slides under desktop on runners",
                     )
                 )
 
-            if self.has_back_panel:
+            if has_back_panel:
                 cut_list.append(
                     LumberPiece(
                         name="Back Panel",
-                        width=self.lumber_width,
-                        height=self.width - (2 * panel_thickness),
+                        width=lumber_width,
+                        height=rail_length,
                         length=leg_panel_height - 200,
                         quantity=1,
-                        material=self.material,
+                        material=material,
                         notes="Cable management panel",
                     )
                 )
 
             # Generate Ruby code
-            ruby_parts = []
-
-            # Desktop
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Desktop",
-                    width=self.width,
-                    height=desktop_thickness,
-                    depth=self.depth,
-                    x=0,
-                    y=0,
-                    z=leg_panel_height,
-                )
-            )
-
-            # Left leg panel
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Left Leg Panel",
-                    width=panel_thickness,
-                    height=leg_panel_height,
-                    depth=leg_panel_depth,
-                    x=left_panel_x,
-                    y=self.depth - leg_panel_depth,
-                    z=0,
-                )
-            )
-
-            # Right leg panel
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Right Leg Panel",
-                    width=panel_thickness,
-                    height=leg_panel_height,
-                    depth=leg_panel_depth,
-                    x=right_panel_x,
-                    y=self.depth - leg_panel_depth,
-                    z=0,
-                )
-            )
-
             # Back rail (connects legs at back, near top)
-            rail_z = leg_panel_height - self.lumber_width - 50
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Back Rail",
-                    width=self.width - (2 * panel_thickness),
-                    height=self.lumber_width,
-                    depth=panel_thickness,
-                    x=panel_thickness,
-                    y=self.depth - panel_thickness,
-                    z=rail_z,
-                )
-            )
+            rail_z = leg_panel_height - lumber_width - 50
+
+            # (name, width, height, depth, x, y, z) per board
+            board_specs = [
+                (
+                    "Desktop",
+                    width,
+                    desktop_thickness,
+                    depth,
+                    0,
+                    0,
+                    leg_panel_height,
+                ),
+                (
+                    "Left Leg Panel",
+                    panel_thickness,
+                    leg_panel_height,
+                    leg_panel_depth,
+                    left_panel_x,
+                    leg_panel_y,
+                    0,
+                ),
+                (
+                    "Right Leg Panel",
+                    panel_thickness,
+                    leg_panel_height,
+                    leg_panel_depth,
+                    right_panel_x,
+                    leg_panel_y,
+                    0,
+                ),
+                (
+                    "Back Rail",
+                    rail_length,
+                    lumber_width,
+                    panel_thickness,
+                    panel_thickness,
+                    depth - panel_thickness,
+                    rail_z,
+                ),
+            ]
 
             # Drawers (simplified box representation)
+            drawer_z = leg_panel_height - drawer_height - 50
             if left_drawer:
-                drawer_z = leg_panel_height - drawer_height - 50
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name="Left Drawer",
-                        width=drawer_unit_width - 20,
-                        height=drawer_height - 10,
-                        depth=leg_panel_depth - 50,
-                        x=panel_thickness + 10,
-                        y=self.depth - leg_panel_depth + 25,
-                        z=drawer_z,
+                board_specs.append(
+                    (
+                        "Left Drawer",
+                        drawer_unit_width - 20,
+                        drawer_height - 10,
+                        leg_panel_depth - 50,
+                        panel_thickness + 10,
+                        leg_panel_y + 25,
+                        drawer_z,
                     )
                 )
 
             if right_drawer:
-                drawer_z = leg_panel_height - drawer_height - 50
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name="Right Drawer",
-                        width=drawer_unit_width - 20,
-                        height=drawer_height - 10,
-                        depth=leg_panel_depth - 50,
-                        x=self.width - panel_thickness - drawer_unit_width + 10,
-                        y=self.depth - leg_panel_depth + 25,
-                        z=drawer_z,
+                board_specs.append(
+                    (
+                        "Right Drawer",
+                        drawer_unit_width - 20,
+                        drawer_height - 10,
+                        leg_panel_depth - 50,
+                        width - panel_thickness - drawer_unit_width + 10,
+                        leg_panel_y + 25,
+                        drawer_z,
                     )
                 )
 
             # Keyboard tray (positioned under desktop, center)
-            if self.has_keyboard_tray:
+            if has_keyboard_tray:
                 tray_z = leg_panel_height - 50
-                tray_x = (self.width - 600) / 2
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name="Keyboard Tray",
-                        width=600,
-                        height=panel_thickness,
-                        depth=300,
-                        x=tray_x,
-                        y=50,  # Near front edge
-                        z=tray_z,
+                tray_x = (width - 600) / 2
+                board_specs.append(
+                    (
+                        "Keyboard Tray",
+                        600,
+                        panel_thickness,
+                        300,
+                        tray_x,
+                        50,  # Near front edge
+                        tray_z,
                     )
                 )
 
             # Back panel
-            if self.has_back_panel:
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name="Back Panel",
-                        width=self.width - (2 * panel_thickness),
-                        height=leg_panel_height - 200,
-                        depth=panel_thickness,
-                        x=panel_thickness,
-                        y=self.depth - panel_thickness - 10,
-                        z=100,
+            if has_back_panel:
+                board_specs.append(
+                    (
+                        "Back Panel",
+                        rail_length,
+                        leg_panel_height - 200,
+                        panel_thickness,
+                        panel_thickness,
+                        depth - panel_thickness - 10,
+                        100,
                     )
                 )
 
             # Combine and wrap
-            ruby_code = "\n".join(ruby_parts)
+            make_board = self._create_board_ruby
+            ruby_code = "\n".join(make_board(*spec) for spec in board_specs)
             ruby_code = self._wrap_in_operation(
                 ruby_code,
-                f"Desk {int(self.width)}x{int(self.height)}x{int(self.depth)}",
+                f"Desk {self._dim_label}",
             )
 
             return TemplateResult(success=True, ruby_code=ruby_code, cut_list=cut_list)
@@ -3,7 +3,7 @@
 import logging
 from typing import Optional
 
-from .base import BaseTemplate, TemplateResult, LumberPiece
+from .base import BaseTemplate, TemplateResult, LumberPiece, memoize_generate
 
 logger = logging.getLogger("SketchupMCPServer")
 
@@ -58,6 +58,7 @@ class PictureFrameTemplate(BaseTemplate):
         self.rabbet_depth = min(rabbet_depth, depth - 5)  # Leave 5mm face
         self.mat_width = mat_width
 
+    @memoize_generate
     def generate(self) -> TemplateResult:
         """Generate picture frame Ruby code and cut list."""
         try:
@@ -97,6 +98,7 @@ class PictureFrameTemplate(BaseTemplate):
             side_length = self.height
 
             # Build cut list
+            rail_notes = f"45° miter cuts both ends, {self.rabbet_depth}mm rabbet"
             cut_list = [
                 LumberPiece(
                     name="Top/Bottom Rail",
@@ -105,7 +107,7 @@ class PictureFrameTemplate(BaseTemplate):
                     length=top_bottom_length,
                     quantity=2,
                     material=self.material,
-                    notes=f"45° miter cuts both ends, {self.rabbet_depth}mm rabbet",
+                    notes=rail_notes,
                 ),
                 LumberPiece(
                     name="Side Rail",
@@ -114,7 +116,7 @@ class PictureFrameTemplate(BaseTemplate):
                     length=side_length,
                     quantity=2,
                     material=self.material,
-                    notes=f"45° miter cuts both ends, {self.rabbet_depth}mm rabbet",
+                    notes=rail_notes,
                 ),
                 LumberPiece(
                     name="Glass",
@@ -150,89 +152,72 @@ class PictureFrameTemplate(BaseTemplate):
                 )
 
             # Generate Ruby code
-            ruby_parts = []
-
-            # Top rail
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Top Rail",
-                    width=self.width,
-                    height=frame_thickness,
-                    depth=self.frame_width,
-                    x=0,
-                    y=0,
-                    z=self.height - self.frame_width,
-                )
-            )
-
-            # Bottom rail
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Bottom Rail",
-                    width=self.width,
-                    height=frame_thickness,
-                    depth=self.frame_width,
-                    x=0,
-                    y=0,
-                    z=0,
-                )
-            )
-
-            # Left rail (between top and bottom)
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Left Rail",
-                    width=self.frame_width,
-                    height=frame_thickness,
-                    depth=inner_height,
-                    x=0,
-                    y=0,
-                    z=self.frame_width,
-                )
-            )
-
-            # Right rail
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Right Rail",
-                    width=self.frame_width,
-                    height=frame_thickness,
-                    depth=inner_height,
-                    x=self.width - self.frame_width,
-                    y=0,
-                    z=self.frame_width,
-                )
-            )
-
             # Glass (inset into rabbet)
             glass_inset = frame_thickness - self.rabbet_depth
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Glass",
-                    width=inner_width + 4,
-                    height=3,
-                    depth=inner_height + 4,
-                    x=self.frame_width - 2,
-                    y=glass_inset,
-                    z=self.frame_width - 2,
-                )
-            )
 
-            # Backing (behind glass)
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Backing",
-                    width=inner_width + 4,
-                    height=3,
-                    depth=inner_height + 4,
-                    x=self.frame_width - 2,
-                    y=glass_inset + 5,
-                    z=self.frame_width - 2,
-                )
-            )
+            # (name, width, height, depth, x, y, z) per board
+            board_specs = [
+                (
+                    "Top Rail",
+                    self.width,
+                    frame_thickness,
+                    self.frame_width,
+                    0,
+                    0,
+                    self.height - self.frame_width,
+                ),
+                (
+                    "Bottom Rail",
+                    self.width,
+                    frame_thickness,
+                    self.frame_width,
+                    0,
+                    0,
+                    0,
+                ),
+                # Left rail (between top and bottom)
+                (
+                    "Left Rail",
+                    self.frame_width,
+                    frame_thickness,
+                    inner_height,
+                    0,
+                    0,
+                    self.frame_width,
+                ),
+                (
+                    "Right Rail",
+                    self.frame_width,
+                    frame_thickness,
+                    inner_height,
+                    self.width - self.frame_width,
+                    0,
+                    self.frame_width,
+                ),
+                (
+                    "Glass",
+                    inner_width + 4,
+                    3,
+                    inner_height + 4,
+                    self.frame_width - 2,
+                    glass_inset,
+                    self.frame_width - 2,
+                ),
+                # Backing (behind glass)
+                (
+                    "Backing",
+                    inner_width + 4,
+                    3,
+                    inner_height + 4,
+                    self.frame_width - 2,
+                    glass_inset + 5,
+                    self.frame_width - 2,
+                ),
+            ]
 
             # Combine and wrap
-            ruby_code = "\n".join(ruby_parts)
+            make_board = self._create_board_ruby
+            ruby_code = "\n".join(make_board(*spec) for spec in board_specs)
             ruby_code = self._wrap_in_operation(
                 ruby_code,
                 f"Picture Frame {int(self.width)}x{int(self.height)}",
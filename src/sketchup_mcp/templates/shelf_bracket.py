@@ -4,7 +4,7 @@ import logging
 import math
 from typing import Optional, Literal
 
-from .base import BaseTemplate, TemplateResult, LumberPiece
+from .base import BaseTemplate, TemplateResult, LumberPiece, memoize_generate
 
 logger = logging.getLogger("SketchupMCPServer")
 
@@ -59,6 +59,7 @@ class ShelfBracketTemplate(BaseTemplate):
         self.bracket_count = max(2, int(bracket_count))
         self.has_shelf = has_shelf
 
+    @memoize_generate
     def generate(self) -> TemplateResult:
         """Generate shelf bracket Ruby code and cut list."""
         try:
@@ -177,112 +178,99 @@ class ShelfBracketTemplate(BaseTemplate):
                 )
 
             # Generate Ruby code
-            ruby_parts = []
-
-            # Generate brackets at spacing intervals
-            for i in range(self.bracket_count):
-                bracket_x = i * bracket_spacing if self.bracket_count > 1 else 0
-
-                if self.bracket_style == "triangle":
+            # Boards making up one bracket, placed at each bracket_x:
+            # (name, width, height, depth, y, z)
+            if self.bracket_style == "triangle":
+                bracket_boards = (
                     # Vertical piece (against wall at y=depth)
-                    ruby_parts.append(
-                        self._create_board_ruby(
-                            name=f"Vertical {i + 1}",
-                            width=board_thickness,
-                            height=vertical_length,
-                            depth=board_width,
-                            x=bracket_x,
-                            y=self.depth - board_width,
-                            z=0,
-                        )
-                    )
-
+                    (
+                        "Vertical",
+                        board_thickness,
+                        vertical_length,
+                        board_width,
+                        self.depth - board_width,
+                        0,
+                    ),
                     # Horizontal piece (at top, extending forward)
-                    ruby_parts.append(
-                        self._create_board_ruby(
-                            name=f"Horizontal {i + 1}",
-                            width=board_thickness,
-                            height=board_width,
-                            depth=horizontal_length,
-                            x=bracket_x,
-                            y=0,
-                            z=vertical_length - board_width,
-                        )
-                    )
-
+                    (
+                        "Horizontal",
+                        board_thickness,
+                        board_width,
+                        horizontal_length,
+                        0,
+                        vertical_length - board_width,
+                    ),
                     # Diagonal brace (simplified as a box - actual would be angled)
                     # Position from bottom-front to top-back corner
-                    ruby_parts.append(
-                        self._create_board_ruby(
-                            name=f"Diagonal {i + 1}",
-                            width=board_thickness,
-                            height=board_width,
-                            depth=diagonal_length * 0.8,  # Approximate
-                            x=bracket_x,
-                            y=board_width,
-                            z=board_width,
-                        )
-                    )
-
-                elif self.bracket_style == "L_bracket":
+                    (
+                        "Diagonal",
+                        board_thickness,
+                        board_width,
+                        diagonal_length * 0.8,  # Approximate
+                        board_width,
+                        board_width,
+                    ),
+                )
+            elif self.bracket_style == "L_bracket":
+                bracket_boards = (
                     # Vertical piece
-                    ruby_parts.append(
-                        self._create_board_ruby(
-                            name=f"Vertical {i + 1}",
-                            width=board_thickness,
-                            height=vertical_length,
-                            depth=board_width,
-                            x=bracket_x,
-                            y=self.depth - board_width,
-                            z=0,
-                        )
-                    )
-
+                    (
+                        "Vertical",
+                        board_thickness,
+                        vertical_length,
+                        board_width,
+                        self.depth - board_width,
+                        0,
+                    ),
                     # Horizontal piece
-                    ruby_parts.append(
-                        self._create_board_ruby(
-                            name=f"Horizontal {i + 1}",
-                            width=board_thickness,
-                            height=board_width,
-                            depth=horizontal_length,
-                            x=bracket_x,
-                            y=0,
-                            z=vertical_length - board_width,
-                        )
-                    )
+                    (
+                        "Horizontal",
+                        board_thickness,
+                        board_width,
+                        horizontal_length,
+                        0,
+                        vertical_length - board_width,
+                    ),
+                )
+            else:  # corbel - simplified as solid block
+                bracket_boards = (
+                    (
+                        "Corbel",
+                        board_thickness,
+                        vertical_length,
+                        horizontal_length,
+                        0,
+                        0,
+                    ),
+                )
 
-                else:  # corbel - simplified as solid block
-                    ruby_parts.append(
-                        self._create_board_ruby(
-                            name=f"Corbel {i + 1}",
-                            width=board_thickness,
-                            height=vertical_length,
-                            depth=horizontal_length,
-                            x=bracket_x,
-                            y=0,
-                            z=0,
-                        )
-                    )
+            # Generate brackets at spacing intervals
+            # (name, width, height, depth, x, y, z) per board
+            board_specs = []
+            for i in range(self.bracket_count):
+                bracket_x = i * bracket_spacing
+                board_specs += [
+                    (f"{name} {i + 1}", width, height, depth, bracket_x, y, z)
+                    for name, width, height, depth, y, z in bracket_boards
+                ]
 
             # Shelf board (sits on top of brackets)
             if self.has_shelf:
-                shelf_z = (
-                    vertical_length - board_width + board_width
-                )  # On top of horizontal
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name="Shelf",
-                        width=self.width,
-                        height=shelf_thickness,
-                        depth=shelf_depth,
-                        x=0,
-                        y=0,
-                        z=vertical_length,
+                board_specs.append(
+                    (
+                        "Shelf",
+                        self.width,
+                        shelf_thickness,
+                        shelf_depth,
+                        0,
+                        0,
+                        vertical_length,  # On top of horizontal
                     )
                 )
 
             # Combine and wrap
-            ruby_code = "\n".join(ruby_parts)
+            make_board = self._create_board_ruby
+            ruby_code = "\n".join(make_board(*spec) for spec in board_specs)
             style_name = self.bracket_style.replace("_", " ").title()
             ruby_code = self._wrap_in_operation(
                 ruby_code,
@@ -3,10 +3,16 @@
 import logging
 from typing import Optional, Literal
 
-from .base import BaseTemplate, TemplateResult, LumberPiece
+from .base import BaseTemplate, TemplateResult, LumberPiece, memoize_generate
 
 logger = logging.getLogger("SketchupMCPServer")
 
+# (name, x index, y index) into the leg positions, one entry per leg
+_LEG_CORNERS = (("Leg 1", 0, 0), ("Leg 2", 1, 0), ("Leg 3", 0, 1), ("Leg 4", 1, 1))
+
+# Display names for the known variants, used in the operation title
+_VARIANT_LABELS = {"dining": "Dining", "coffee": "Coffee", "end": "End"}
+
 
 class TableTemplate(BaseTemplate):
     """Template for creating tables with various configurations."""
@@ -76,51 +82,56 @@ class TableTemplate(BaseTemplate):
         self.has_stretchers = has_stretchers
         self.leg_inset = leg_inset
 
+    @memoize_generate
     def generate(self) -> TemplateResult:
         """Generate table Ruby code and cut list."""
         try:
+            # Bind instance attributes used throughout to locals
+            width, height, depth = self.width, self.height, self.depth
+            leg_inset, material, joinery = self.leg_inset, self.material, self.joinery
+
             # Calculate dimensions
             leg_size = self.lumber_thickness  # Square legs
             tabletop_thickness = self.lumber_thickness
             apron_height = self.lumber_width
             apron_thickness = self.lumber_thickness
 
-            # Leg positions (inset from corners)
-            leg_x_positions = [self.leg_inset, self.width - self.leg_inset - leg_size]
-            leg_y_positions = [self.leg_inset, self.depth - self.leg_inset - leg_size]
-
             # Apron lengths (between legs)
-            long_apron_length = self.width - (2 * self.leg_inset) - (2 * leg_size)
-            short_apron_length = self.depth - (2 * self.leg_inset) - (2 * leg_size)
+            long_apron_length = width - (2 * leg_inset) - (2 * leg_size)
+            short_apron_length = depth - (2 * leg_inset) - (2 * leg_size)
 
             # Leg height (from floor to underside of tabletop)
-            leg_height = self.height - tabletop_thickness
+            leg_height = height - tabletop_thickness
 
             # Validate dimensions
             if long_apron_length <= 0 or short_apron_length <= 0:
                 return TemplateResult(
                     success=False,
-                    error=f"Table dimensions too small for {leg_size}mm legs with {self.leg_inset}mm inset. "
-                    f"Width must be > {2 * self.leg_inset + 2 * leg_size}mm, "
-                    f"depth must be > {2 * self.leg_inset + 2 * leg_size}mm",
+                    error=f"Table dimensions too small for {leg_size}mm legs with {leg_inset}mm inset. "
+                    f"Width must be > {2 * leg_inset + 2 * leg_size}mm, "
+                    f"depth must be > {2 * leg_inset + 2 * leg_size}mm",
                 )
 
             if leg_height <= apron_height:
                 return TemplateResult(
                     success=False,
-                    error=f"Table height {self.height}mm too small for {apron_height}mm aprons. "
+                    error=f"Table height {height}mm too small for {apron_height}mm aprons. "
                     f"Minimum height: {tabletop_thickness + apron_height + 50}mm",
                 )
 
+            # Leg positions (inset from corners)
+            leg_x_positions = (leg_inset, width - leg_inset - leg_size)
+            leg_y_positions = (leg_inset, depth - leg_inset - leg_size)
+
             # Build cut list
             cut_list = [
                 LumberPiece(
                     name="Tabletop",
                     width=tabletop_thickness,
-                    height=self.width,
-                    length=self.depth,
+                    height=width,
+                    length=depth,
                     quantity=1,
-                    material=self.material,
+                    material=material,
                     notes="Solid or glued-up panel",
                 ),
                 LumberPiece(
@@ -129,222 +140,134 @@ class TableTemplate(BaseTemplate):
                     height=leg_size,
                     length=leg_height,
                     quantity=4,
-                    material=self.material,
-                    notes=f"Square legs, {self.joinery} joints",
+                    material=material,
+                    notes=f"Square legs, {joinery} joints",
                 ),
             ]
 
             if self.has_aprons:
-                cut_list.extend(
-                    [
-                        LumberPiece(
-                            name="Long Apron",
-                            width=apron_thickness,
-                            height=apron_height,
-                            length=long_apron_length,
-                            quantity=2,
-                            material=self.material,
-                            notes=f"Front and back aprons, {self.joinery}",
-                        ),
-                        LumberPiece(
-                            name="Short Apron",
-                            width=apron_thickness,
-                            height=apron_height,
-                            length=short_apron_length,
-                            quantity=2,
-                            material=self.material,
-                            notes=f"Side aprons, {self.joinery}",
-                        ),
-                    ]
-                )
-
-            if self.has_stretchers:
-                stretcher_height = leg_height / 3  # Position at 1/3 height
-                cut_list.extend(
-                    [
-                        LumberPiece(
-                            name="Long Stretcher",
-                            width=apron_thickness,
-                            height=apron_height,
-                            length=long_apron_length,
-                            quantity=2,
-                            material=self.material,
-                            notes="Front and back stretchers",
-                        ),
-                        LumberPiece(
-                            name="Short Stretcher",
-                            width=apron_thickness,
-                            height=apron_height,
-                            length=short_apron_length,
-                            quantity=2,
-                            material=self.material,
-                            notes="Side stretchers",
-                        ),
-                    ]
-                )
-
-            # Generate Ruby code
-            ruby_parts = []
-
-            # Tabletop
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Tabletop",
-                    width=self.width,
-                    height=tabletop_thickness,
-                    depth=self.depth,
-                    x=0,
-                    y=0,
-                    z=leg_height,
-                )
-            )
-
-            # Four legs at corners
-            for i, (lx, ly) in enumerate(
-                [
-                    (leg_x_positions[0], leg_y_positions[0]),
-                    (leg_x_positions[1], leg_y_positions[0]),
-                    (leg_x_positions[0], leg_y_positions[1]),
-                    (leg_x_positions[1], leg_y_positions[1]),
-                ]
-            ):
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name=f"Leg {i + 1}",
-                        width=leg_size,
-                        height=leg_height,
-                        depth=leg_size,
-                        x=lx,
-                        y=ly,
-                        z=0,
-                    )
-                )
-
-            # Aprons (positioned under tabletop, between legs)
-            if self.has_aprons:
-                apron_z = leg_height - apron_height
-
-                # Front apron
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name="Front Apron",
-                        width=long_apron_length,
+                cut_list.append(
+                    LumberPiece(
+                        name="Long Apron",
+                        width=apron_thickness,
                         height=apron_height,
-                        depth=apron_thickness,
-                        x=leg_x_positions[0] + leg_size,
-                        y=leg_y_positions[0],
-                        z=apron_z,
+                        length=long_apron_length,
+                        quantity=2,
+                        material=material,
+                        notes=f"Front and back aprons, {joinery}",
                     )
                 )
-
-                # Back apron
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name="Back Apron",
-                        width=long_apron_length,
+                cut_list.append(
+                    LumberPiece(
+                        name="Short Apron",
+                        width=apron_thickness,
                         height=apron_height,
-                        depth=apron_thickness,
-                        x=leg_x_positions[0] + leg_size,
-                        y=leg_y_positions[1] + leg_size - apron_thickness,
-                        z=apron_z,
+                        length=short_apron_length,
+                        quantity=2,
+                        material=material,
+                        notes=f"Side aprons, {joinery}",
                     )
                 )
 
-                # Left apron
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name="Left Apron",
+            if self.has_stretchers:
+                cut_list.append(
+                    LumberPiece(
+                        name="Long Stretcher",
                         width=apron_thickness,
                         height=apron_height,
-                        depth=short_apron_length,
-                        x=leg_x_positions[0],
-                        y=leg_y_positions[0] + leg_size,
-                        z=apron_z,
+                        length=long_apron_length,
+                        quantity=2,
+                        material=material,
+                        notes="Front and back stretchers",
                     )
                 )
-
-                # Right apron
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name="Right Apron",
+                cut_list.append(
+                    LumberPiece(
+                        name="Short Stretcher",
                         width=apron_thickness,
                         height=apron_height,
-                        depth=short_apron_length,
-                        x=leg_x_positions[1] + leg_size - apron_thickness,
-                        y=leg_y_positions[0] + leg_size,
-                        z=apron_z,
+                        length=short_apron_length,
+                        quantity=2,
+                        material=material,
+                        notes="Side stretchers",
                     )
                 )
 
-            # Stretchers (positioned at 1/3 height)
-            if self.has_stretchers:
-                stretcher_z = leg_height / 3 - apron_height / 2
+            # Generate Ruby code
+            # (name, width, height, depth, x, y, z) per board
+            board_specs = [
+                (
+                    "Tabletop",
+                    width,
+                    tabletop_thickness,
+                    depth,
+                    0,
+                    0,
+                    leg_height,
+                ),
+            ]
 
-                # Front stretcher
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name="Front Stretcher",
-                        width=long_apron_length,
-                        height=apron_height,
-                        depth=apron_thickness,
-                        x=leg_x_positions[0] + leg_size,
-                        y=leg_y_positions[0],
-                        z=stretcher_z,
-                    )
+            # Four legs at corners
+            board_specs += [
+                (
+                    name,
+                    leg_size,
+                    leg_height,
+                    leg_size,
+                    leg_x_positions[xi],
+                    leg_y_positions[yi],
+                    0,
                 )
+                for name, xi, yi in _LEG_CORNERS
+            ]
 
-                # Back stretcher
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name="Back Stretcher",
-                        width=long_apron_length,
-                        height=apron_height,
-                        depth=apron_thickness,
-                        x=leg_x_positions[0] + leg_size,
-                        y=leg_y_positions[1] + leg_size - apron_thickness,
-                        z=stretcher_z,
-                    )
-                )
+            # Apron/stretcher offsets, shared by both rings of rails
+            front_y = leg_y_positions[0]
+            left_x = leg_x_positions[0]
+            inner_x = left_x + leg_size  # Front/back rails start
+            inner_y = front_y + leg_size  # Side rails start
+            back_y = leg_y_positions[1] + leg_size - apron_thickness
+            right_x = leg_x_positions[1] + leg_size - apron_thickness
+
+            # (side, width, depth, x, y) per rail in a ring
+            rails = (
+                ("Front", long_apron_length, apron_thickness, inner_x, front_y),
+                ("Back", long_apron_length, apron_thickness, inner_x, back_y),
+                ("Left", apron_thickness, short_apron_length, left_x, inner_y),
+                ("Right", apron_thickness, short_apron_length, right_x, inner_y),
+            )
 
-                # Left stretcher
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name="Left Stretcher",
-                        width=apron_thickness,
-                        height=apron_height,
-                        depth=short_apron_length,
-                        x=leg_x_positions[0],
-                        y=leg_y_positions[0] + leg_size,
-                        z=stretcher_z,
-                    )
-                )
+            # (kind, z) per ring: aprons under the tabletop, stretchers
+            # at 1/3 height
+            rail_levels = []
+            if self.has_aprons:
+                rail_levels.append(("Apron", leg_height - apron_height))
+            if self.has_stretchers:
+                rail_levels.append(("Stretcher", leg_height / 3 - apron_height / 2))
 
-                # Right stretcher
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name="Right Stretcher",
-                        width=apron_thickness,
-                        height=apron_height,
-                        depth=short_apron_length,
-                        x=leg_x_positions[1] + leg_size - apron_thickness,
-                        y=leg_y_positions[0] + leg_size,
-                        z=stretcher_z,
-                    )
-                )
+            board_specs += [
+                (f"{side} {kind}", w, apron_height, d, x, y, z)
+                for kind, z in rail_levels
+                for side, w, d, x, y in rails
+            ]
 
             # Combine and wrap
-            ruby_code = "\n".join(ruby_parts)
-            variant_name = self.variant.replace("_", " ").title()
+            make_board = self._create_board_ruby
+            ruby_code = "\n".join(make_board(*spec) for spec in board_specs)
+            variant = self.variant
+            variant_name = (
+                _VARIANT_LABELS.get(variant) or variant.replace("_", " ").title()
+            )
             ruby_code = self._wrap_in_operation(
                 ruby_code,
-                f"{variant_name} Table {int(self.width)}x{int(self.height)}x{int(self.depth)}",
+                f"{variant_name} Table {self._dim_label}",
             )
 
             return TemplateResult(success=True, ruby_code=ruby_code, cut_list=cut_list)
 
         except ValueError as e:
-            logger.warning(f"Table template validation error: {e}")
+            logger.warning("Table template validation error: %s", e)
             return TemplateResult(success=False, error=str(e))
         except Exception as e:
-            logger.exception(f"Table template unexpected error: {e}")
+            logger.exception("Table template unexpected error: %s", e)
             raise
@@ -3,7 +3,7 @@
 import logging
 from typing import Optional
 
-from .base import BaseTemplate, TemplateResult, LumberPiece
+from .base import BaseTemplate, TemplateResult, LumberPiece, memoize_generate
 
 logger = logging.getLogger("SketchupMCPServer")
 
@@ -63,29 +63,34 @@ class TrayTemplate(BaseTemplate):
         self.has_dividers = has_dividers
         self.divider_count = max(1, int(divider_count))
 
+    @memoize_generate
     def generate(self) -> TemplateResult:
         """Generate tray Ruby code and cut list."""
         try:
+            # Bind instance attributes used throughout to locals
+            width, depth, wall_height = self.width, self.depth, self.wall_height
+            material, divider_count = self.material, self.divider_count
+
             # Calculate dimensions
             wall_thickness = self.lumber_thickness
             bottom_thickness = self.lumber_thickness
 
             # Interior dimensions
-            interior_width = self.width - (2 * wall_thickness)
-            interior_depth = self.depth - (2 * wall_thickness)
+            interior_width = width - (2 * wall_thickness)
+            interior_depth = depth - (2 * wall_thickness)
 
             # Validate dimensions
             if interior_width <= 0 or interior_depth <= 0:
                 return TemplateResult(
                     success=False,
-                    error=f"Tray dimensions ({self.width}x{self.depth}mm) too small for "
+                    error=f"Tray dimensions ({width}x{depth}mm) too small for "
                     f"{wall_thickness}mm walls. Minimum: {2 * wall_thickness + 50}mm each side.",
                 )
 
-            if self.wall_height < 20:
+            if wall_height < 20:
                 return TemplateResult(
                     success=False,
-                    error=f"Wall height {self.wall_height}mm too small. Minimum: 20mm",
+                    error=f"Wall height {wall_height}mm too small. Minimum: 20mm",
                 )
 
             # Build cut list
@@ -96,25 +101,25 @@ class TrayTemplate(BaseTemplate):
                     height=interior_width,
                     length=interior_depth,
                     quantity=1,
-                    material=self.material,
+                    material=material,
                     notes="Bottom panel, rabbeted into walls",
                 ),
                 LumberPiece(
                     name="Long Wall",
                     width=wall_thickness,
-                    height=self.width,
-                    length=self.wall_height,
+                    height=width,
+                    length=wall_height,
                     quantity=2,
-                    material=self.material,
+                    material=material,
                     notes=f"Front and back walls, {self.joinery} corners",
                 ),
                 LumberPiece(
                     name="End Wall",
                     width=wall_thickness,
                     height=interior_depth,
-                    length=self.wall_height,
+                    length=wall_height,
                     quantity=2,
-                    material=self.material,
+                    material=material,
                     notes="End walls with handle cutouts"
                     if self.has_handles
                     else "End walls",
@@ -128,113 +133,96 @@ class TrayTemplate(BaseTemplate):
                         name="Divider",
                         width=wall_thickness,
                         height=divider_length,
-                        length=self.wall_height - 10,
-                        quantity=self.divider_count,
-                        material=self.material,
+                        length=wall_height - 10,
+                        quantity=divider_count,
+                        material=material,
                         notes="Internal dividers",
                     )
                 )
 
             # Generate Ruby code
-            ruby_parts = []
-
-            # Bottom panel
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Bottom",
-                    width=interior_width,
-                    height=bottom_thickness,
-                    depth=interior_depth,
-                    x=wall_thickness,
-                    y=wall_thickness,
-                    z=0,
-                )
-            )
-
-            # Front wall (long side)
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Front Wall",
-                    width=self.width,
-                    height=self.wall_height,
-                    depth=wall_thickness,
-                    x=0,
-                    y=0,
-                    z=bottom_thickness,
-                )
-            )
-
-            # Back wall (long side)
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Back Wall",
-                    width=self.width,
-                    height=self.wall_height,
-                    depth=wall_thickness,
-                    x=0,
-                    y=self.depth - wall_thickness,
-                    z=bottom_thickness,
-                )
-            )
-
-            # Left end wall (short side, between front and back)
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Left End Wall",
-                    width=wall_thickness,
-                    height=self.wall_height,
-                    depth=interior_depth,
-                    x=0,
-                    y=wall_thickness,
-                    z=bottom_thickness,
-                )
-            )
-
-            # Right end wall
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Right End Wall",
-                    width=wall_thickness,
-                    height=self.wall_height,
-                    depth=interior_depth,
-                    x=self.width - wall_thickness,
-                    y=wall_thickness,
-                    z=bottom_thickness,
-                )
-            )
+            # (name, width, height, depth, x, y, z) per board
+            board_specs = [
+                # Bottom panel
+                (
+                    "Bottom",
+                    interior_width,
+                    bottom_thickness,
+                    interior_depth,
+                    wall_thickness,
+                    wall_thickness,
+                    0,
+                ),
+                # Front and back walls (long sides)
+                (
+                    "Front Wall",
+                    width,
+                    wall_height,
+                    wall_thickness,
+                    0,
+                    0,
+                    bottom_thickness,
+                ),
+                (
+                    "Back Wall",
+                    width,
+                    wall_height,
+                    wall_thickness,
+                    0,
+                    depth - wall_thickness,
+                    bottom_thickness,
+                ),
+                # End walls (short sides, between front and back)
+                (
+                    "Left End Wall",
+                    wall_thickness,
+                    wall_height,
+                    interior_depth,
+                    0,
+                    wall_thickness,
+                    bottom_thickness,
+                ),
+                (
+                    "Right End Wall",
+                    wall_thickness,
+                    wall_height,
+                    interior_depth,
+                    width - wall_thickness,
+                    wall_thickness,
+                    bottom_thickness,
+                ),
+            ]
 
             # Dividers (vertical partitions along width)
             if self.has_dividers:
-                section_width = interior_width / (self.divider_count + 1)
-                for i in range(self.divider_count):
-                    divider_x = (
-                        wall_thickness + (i + 1) * section_width - wall_thickness / 2
-                    )
-                    ruby_parts.append(
-                        self._create_board_ruby(
-                            name=f"Divider {i + 1}",
-                            width=wall_thickness,
-                            height=self.wall_height - 10,
-                            depth=interior_depth - 10,
-                            x=divider_x,
-                            y=wall_thickness + 5,
-                            z=bottom_thickness,
-                        )
+                section_width = interior_width / (divider_count + 1)
+                board_specs += [
+                    (
+                        f"Divider {i + 1}",
+                        wall_thickness,
+                        wall_height - 10,
+                        interior_depth - 10,
+                        wall_thickness + (i + 1) * section_width - wall_thickness / 2,
+                        wall_thickness + 5,
+                        bottom_thickness,
                     )
+                    for i in range(divider_count)
+                ]
 
             # Combine and wrap
-            ruby_code = "\n".join(ruby_parts)
+            make_board = self._create_board_ruby
+            ruby_code = "\n".join(make_board(*spec) for spec in board_specs)
             handle_text = " with Handles" if self.has_handles else ""
             ruby_code = self._wrap_in_operation(
                 ruby_code,
-                f"Serving Tray{handle_text} {int(self.width)}x{int(self.depth)}",
+                f"Serving Tray{handle_text} {int(width)}x{int(depth)}",
             )
 
             return TemplateResult(success=True, ruby_code=ruby_code, cut_list=cut_list)
 
         except ValueError as e:
-            logger.warning(f"Tray template validation error: {e}")
+            logger.warning("Tray template validation error: %s", e)
             return TemplateResult(success=False, error=str(e))
         except Exception as e:
-            logger.exception(f"Tray template unexpected error: {e}")
+            logger.exception("Tray template unexpected error: %s", e)
             raise
@@ -1,9 +1,10 @@
 """Workbench template - heavy-duty workshop workbench."""
 
 import logging
+from itertools import product
 from typing import Optional, Literal
 
-from .base import BaseTemplate, TemplateResult, LumberPiece
+from .base import BaseTemplate, TemplateResult, LumberPiece, memoize_generate
 
 logger = logging.getLogger("SketchupMCPServer")
 
@@ -61,6 +62,7 @@ class WorkbenchTemplate(BaseTemplate):
         self.apron_style = apron_style
         self.top_thickness = max(45, top_thickness)  # Minimum 45mm for workbench
 
+    @memoize_generate
     def generate(self) -> TemplateResult:
         """Generate workbench Ruby code and cut list."""
         try:
@@ -217,186 +219,118 @@ class WorkbenchTemplate(BaseTemplate):
                 )
 
             # Generate Ruby code
-            ruby_parts = []
-
-            # Benchtop
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Benchtop",
-                    width=self.width,
-                    height=self.top_thickness,
-                    depth=self.depth,
-                    x=0,
-                    y=0,
-                    z=leg_height,
-                )
-            )
+            # (name, width, height, depth, x, y, z) per board
+            board_specs = [
+                (
+                    "Benchtop",
+                    self.width,
+                    self.top_thickness,
+                    self.depth,
+                    0,
+                    0,
+                    leg_height,
+                ),
+            ]
 
             # Legs at all positions
-            leg_num = 1
-            for lx in leg_x_positions:
-                for ly in leg_y_positions:
-                    ruby_parts.append(
-                        self._create_board_ruby(
-                            name=f"Leg {leg_num}",
-                            width=leg_size,
-                            height=leg_height,
-                            depth=leg_size,
-                            x=lx,
-                            y=ly,
-                            z=0,
-                        )
-                    )
-                    leg_num += 1
-
-            # Upper aprons/rails (under benchtop)
-            apron_z = leg_height - apron_height
-
-            # Front and back long aprons
-            for section_idx in range(len(leg_x_positions) - 1):
-                start_x = leg_x_positions[section_idx] + leg_size
-                section_length = leg_x_positions[section_idx + 1] - start_x
-
-                # Front apron
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name=f"Front Apron {section_idx + 1}",
-                        width=section_length,
-                        height=apron_height,
-                        depth=apron_thickness,
-                        x=start_x,
-                        y=leg_y_positions[0],
-                        z=apron_z,
-                    )
-                )
-
-                # Back apron
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name=f"Back Apron {section_idx + 1}",
-                        width=section_length,
-                        height=apron_height,
-                        depth=apron_thickness,
-                        x=start_x,
-                        y=leg_y_positions[1] + leg_size - apron_thickness,
-                        z=apron_z,
-                    )
-                )
-
-            # End aprons
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Left Apron",
-                    width=apron_thickness,
-                    height=apron_height,
-                    depth=short_rail_length,
-                    x=leg_x_positions[0],
-                    y=leg_y_positions[0] + leg_size,
-                    z=apron_z,
-                )
-            )
-
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Right Apron",
-                    width=apron_thickness,
-                    height=apron_height,
-                    depth=short_rail_length,
-                    x=leg_x_positions[-1] + leg_size - apron_thickness,
-                    y=leg_y_positions[0] + leg_size,
-                    z=apron_z,
-                )
-            )
-
-            # Lower stretchers (at shelf height)
-            stretcher_z = shelf_z - apron_height
-
-            for section_idx in range(len(leg_x_positions) - 1):
-                start_x = leg_x_positions[section_idx] + leg_size
-                section_length = leg_x_positions[section_idx + 1] - start_x
-
-                # Front stretcher
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name=f"Front Stretcher {section_idx + 1}",
-                        width=section_length,
-                        height=apron_height,
-                        depth=apron_thickness,
-                        x=start_x,
-                        y=leg_y_positions[0],
-                        z=stretcher_z,
-                    )
-                )
-
-                # Back stretcher
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name=f"Back Stretcher {section_idx + 1}",
-                        width=section_length,
-                        height=apron_height,
-                        depth=apron_thickness,
-                        x=start_x,
-                        y=leg_y_positions[1] + leg_size - apron_thickness,
-                        z=stretcher_z,
-                    )
+            board_specs += [
+                (f"Leg {i}", leg_size, leg_height, leg_size, lx, ly, 0)
+                for i, (lx, ly) in enumerate(
+                    product(leg_x_positions, leg_y_positions), start=1
                 )
+            ]
 
-            # End stretchers
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Left Stretcher",
-                    width=apron_thickness,
-                    height=apron_height,
-                    depth=short_rail_length,
-                    x=leg_x_positions[0],
-                    y=leg_y_positions[0] + leg_size,
-                    z=stretcher_z,
-                )
+            # Long-rail sections between neighbouring legs: (start x, length)
+            sections = [
+                (x0 + leg_size, x1 - (x0 + leg_size))
+                for x0, x1 in zip(leg_x_positions, leg_x_positions[1:])
+            ]
+            front_y = leg_y_positions[0]
+            back_y = leg_y_positions[1] + leg_size - apron_thickness
+            end_y = leg_y_positions[0] + leg_size
+            left_x = leg_x_positions[0]
+            right_x = leg_x_positions[-1] + leg_size - apron_thickness
+
+            # Upper aprons under the benchtop, lower stretchers at shelf height
+            rail_levels = (
+                ("Apron", leg_height - apron_height),
+                ("Stretcher", shelf_z - apron_height),
             )
+            for kind, z in rail_levels:
+                # Front and back long rails, one per section
+                for i, (start_x, length) in enumerate(sections, start=1):
+                    board_specs += [
+                        (
+                            f"Front {kind} {i}",
+                            length,
+                            apron_height,
+                            apron_thickness,
+                            start_x,
+                            front_y,
+                            z,
+                        ),
+                        (
+                            f"Back {kind} {i}",
+                            length,
+                            apron_height,
+                            apron_thickness,
+                            start_x,
+                            back_y,
+                            z,
+                        ),
+                    ]
 
-            ruby_parts.append(
-                self._create_board_ruby(
-                    name="Right Stretcher",
-                    width=apron_thickness,
-                    height=apron_height,
-                    depth=short_rail_length,
-                    x=leg_x_positions[-1] + leg_size - apron_thickness,
-                    y=leg_y_positions[0] + leg_size,
-                    z=stretcher_z,
-                )
-            )
+                # End rails
+                board_specs += [
+                    (
+                        f"Left {kind}",
+                        apron_thickness,
+                        apron_height,
+                        short_rail_length,
+                        left_x,
+                        end_y,
+                        z,
+                    ),
+                    (
+                        f"Right {kind}",
+                        apron_thickness,
+                        apron_height,
+                        short_rail_length,
+                        right_x,
+                        end_y,
+                        z,
+                    ),
+                ]
 
             # Lower shelf
             if self.has_shelf:
                 shelf_x = leg_x_positions[0] + leg_size
                 shelf_y = leg_y_positions[0] + leg_size
-                shelf_width_actual = leg_x_positions[-1] - shelf_x
-                shelf_depth_actual = leg_y_positions[1] - shelf_y
-
-                ruby_parts.append(
-                    self._create_board_ruby(
-                        name="Lower Shelf",
-                        width=shelf_width_actual,
-                        height=self.lumber_thickness,
-                        depth=shelf_depth_actual,
-                        x=shelf_x,
-                        y=shelf_y,
-                        z=shelf_z,
+                board_specs.append(
+                    (
+                        "Lower Shelf",
+                        leg_x_positions[-1] - shelf_x,
+                        self.lumber_thickness,
+                        leg_y_positions[1] - shelf_y,
+                        shelf_x,
+                        shelf_y,
+                        shelf_z,
                     )
                 )
 
             # Combine and wrap
-            ruby_code = "\n".join(ruby_parts)
+            make_board = self._create_board_ruby
+            ruby_code = "\n".join(make_board(*spec) for spec in board_specs)
             ruby_code = self._wrap_in_operation(
                 ruby_code,
-                f"Workbench {int(self.width)}x{int(self.height)}x{int(self.depth)}",
+                f"Workbench {self._dim_label}",
             )
 
             return TemplateResult(success=True, ruby_code=ruby_code, cut_list=cut_list)
 
         except ValueError as e:
-            logger.warning(f"Workbench template validation error: {e}")
+            logger.warning("Workbench template validation error: %s", e)
             return TemplateResult(success=False, error=str(e))
         except Exception as e:
-            logger.exception(f"Workbench template unexpected error: {e}")
+            logger.exception("Workbench template unexpected error: %s", e)
             raise
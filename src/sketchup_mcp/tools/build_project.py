@@ -1,14 +1,17 @@
 """build_project - Create woodworking projects from templates."""
 
-import json
 import logging
 from typing import Any, Dict, Optional
 
-from ..connection import get_connection, parse_tool_response
+from ..connection import parse_tool_response, pooled_connection
+from ..serialization import dumps
 from ..templates import TEMPLATES, TemplateResult
 
 logger = logging.getLogger("SketchupMCPServer")
 
+# Template names for the unknown-template error message
+_AVAILABLE_TEMPLATES = ", ".join(TEMPLATES)
+
 
 def build_project(
     template_type: str,
@@ -41,20 +44,18 @@ def build_project(
         JSON string with success status, cut_list, and result or error
     """
     # Validate template type
-    if not template_type or template_type.lower() not in TEMPLATES:
-        available = ", ".join(TEMPLATES.keys())
-        return json.dumps(
+    template_class = TEMPLATES.get(template_type.lower()) if template_type else None
+    if template_class is None:
+        return dumps(
             {
                 "success": False,
-                "error": f"Unknown template type: '{template_type}'. Available: {available}",
+                "error": f"Unknown template type: '{template_type}'. Available: {_AVAILABLE_TEMPLATES}",
             }
         )
 
-    template_class = TEMPLATES[template_type.lower()]
-
     try:
         logger.info(
-            f"build_project: template={template_type}, {width}x{height}x{depth}"
+            "build_project: template=%s, %sx%sx%s", template_type, width, height, depth
         )
 
         # Build kwargs, only including specified values
@@ -80,24 +81,24 @@ def build_project(
         result: TemplateResult = template.generate()
 
         if not result.success:
-            return json.dumps({"success": False, "error": result.error})
+            return dumps({"success": False, "error": result.error})
 
         # Execute the Ruby code via eval_ruby
-        connection = get_connection()
-        eval_result = connection.send_command(
-            tool_name="eval_ruby",
-            arguments={"code": result.ruby_code},
-            request_id=request_id,
-        )
+        with pooled_connection() as connection:
+            eval_result = connection.send_command(
+                tool_name="eval_ruby",
+                arguments={"code": result.ruby_code},
+                request_id=request_id,
+            )
 
         success, text = parse_tool_response(eval_result)
 
         if success:
-            return json.dumps(
+            return dumps(
                 {
                     "success": True,
                     "result": text,
-                    "cut_list": result.to_dict()["cut_list"],
+                    "cut_list": result.cut_list,
                     "template": template_type,
                     "dimensions": {
                         "width": template.width,
@@ -107,7 +108,7 @@ def build_project(
                 }
             )
         else:
-            return json.dumps(
+            return dumps(
                 {
                     "success": False,
                     "error": f"SketchUp error: {text}",
@@ -116,8 +117,8 @@ def build_project(
             )
 
     except ConnectionError as e:
-        logger.error(f"build_project connection error: {e}")
-        return json.dumps(
+        logger.error("build_project connection error: %s", e)
+        return dumps(
             {
                 "success": False,
                 "error": str(e),
@@ -126,11 +127,11 @@ def build_project(
         )
 
     except (ValueError, TypeError) as e:
-        logger.warning(f"build_project validation error: {e}")
-        return json.dumps({"success": False, "error": str(e)})
+        logger.warning("build_project validation error: %s", e)
+        return dumps({"success": False, "error": str(e)})
 
     except Exception as e:
-        logger.exception(f"build_project unexpected error: {e}")
+        logger.exception("build_project unexpected error: %s", e)
         raise
 
 
@@ -147,7 +148,7 @@ def list_templates() -> str:
             info = cls.get_template_info()
             templates.append(info)
 
-        return json.dumps({"success": True, "templates": templates})
+        return dumps({"success": True, "templates": templates})
     except Exception as e:
-        logger.exception(f"list_templates unexpected error: {e}")
+        logger.exception("list_templates unexpected error: %s", e)
         raise
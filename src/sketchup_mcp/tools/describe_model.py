@@ -1,10 +1,10 @@
 """describe_model tool - Get information about the current SketchUp model"""
 
-import json
 import logging
 from typing import Any
 
-from ..connection import get_connection, parse_tool_response
+from ..connection import parse_tool_response, pooled_connection
+from ..serialization import dumps
 
 logger = logging.getLogger("SketchupMCPServer")
 
@@ -27,25 +27,25 @@ def describe_model(include_details: bool = False, request_id: Any = None) -> str
         JSON string with model description
     """
     try:
-        logger.info(f"describe_model: include_details={include_details}")
+        logger.info("describe_model: include_details=%s", include_details)
 
-        connection = get_connection()
-        result = connection.send_command(
-            tool_name="describe_model",
-            arguments={"include_details": include_details},
-            request_id=request_id,
-        )
+        with pooled_connection() as connection:
+            result = connection.send_command(
+                tool_name="describe_model",
+                arguments={"include_details": include_details},
+                request_id=request_id,
+            )
 
         success, text = parse_tool_response(result)
         if success:
             # The Ruby side returns JSON, pass it through
             return text
         else:
-            return json.dumps({"success": False, "error": text})
+            return dumps({"success": False, "error": text})
 
     except ConnectionError as e:
-        logger.error(f"describe_model connection error: {str(e)}")
-        return json.dumps(
+        logger.error("describe_model connection error: %s", e)
+        return dumps(
             {
                 "success": False,
                 "error": str(e),
@@ -54,5 +54,5 @@ def describe_model(include_details: bool = False, request_id: Any = None) -> str
         )
 
     except Exception as e:
-        logger.error(f"describe_model error: {str(e)}")
-        return json.dumps({"success": False, "error": str(e)})
+        logger.error("describe_model error: %s", e)
+        return dumps({"success": False, "error": str(e)})
@@ -5,7 +5,8 @@ import logging
 import socket
 from typing import Any
 
-from ..connection import get_connection, parse_tool_response
+from ..connection import parse_tool_response, pooled_connection
+from ..serialization import dumps
 
 logger = logging.getLogger("SketchupMCPServer")
 
@@ -34,25 +35,25 @@ def eval_ruby(code: str, request_id: Any = None) -> str:
         eval_ruby("model = Sketchup.active_model; model.entities.add_face([0,0,0], [10,0,0], [10,10,0], [0,10,0])")
     """
     if not code or not code.strip():
-        return json.dumps({"success": False, "error": "No code provided"})
+        return dumps({"success": False, "error": "No code provided"})
 
     try:
-        logger.info(f"eval_ruby: executing {len(code)} chars of Ruby code")
+        logger.info("eval_ruby: executing %d chars of Ruby code", len(code))
 
-        connection = get_connection()
-        result = connection.send_command(
-            tool_name="eval_ruby", arguments={"code": code}, request_id=request_id
-        )
+        with pooled_connection() as connection:
+            result = connection.send_command(
+                tool_name="eval_ruby", arguments={"code": code}, request_id=request_id
+            )
 
         success, text = parse_tool_response(result)
         if success:
-            return json.dumps({"success": True, "result": text})
+            return dumps({"success": True, "result": text})
         else:
-            return json.dumps({"success": False, "error": text})
+            return dumps({"success": False, "error": text})
 
     except ConnectionError as e:
-        logger.error(f"eval_ruby connection error: {str(e)}")
-        return json.dumps(
+        logger.error("eval_ruby connection error: %s", e)
+        return dumps(
             {
                 "success": False,
                 "error": str(e),
@@ -61,10 +62,10 @@ def eval_ruby(code: str, request_id: Any = None) -> str:
         )
 
     except (socket.timeout, json.JSONDecodeError) as e:
-        logger.error(f"eval_ruby communication error: {str(e)}")
-        return json.dumps({"success": False, "error": f"Communication error: {str(e)}"})
+        logger.error("eval_ruby communication error: %s", e)
+        return dumps({"success": False, "error": f"Communication error: {str(e)}"})
 
     except Exception as e:
         # Let unexpected errors propagate for debugging
-        logger.exception(f"eval_ruby unexpected error: {str(e)}")
+        logger.exception("eval_ruby unexpected error: %s", e)
         raise
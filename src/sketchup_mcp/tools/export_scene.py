@@ -6,10 +6,15 @@ import socket
 from typing import Any, Optional
 
 from ..config import config
-from ..connection import get_connection, parse_tool_response
+from ..connection import parse_tool_response, pooled_connection
+from ..serialization import dumps
 
 logger = logging.getLogger("SketchupMCPServer")
 
+# Supported export formats, in the order listed in error messages
+_EXPORT_FORMATS = ("skp", "png", "jpg", "jpeg")
+_VALID_FORMATS = frozenset(_EXPORT_FORMATS)
+
 
 def export_scene(
     export_format: str = "skp",
@@ -35,20 +40,19 @@ def export_scene(
         - jpg/jpeg: JPEG image
     """
     export_format = export_format.lower()
-    valid_formats = ["skp", "png", "jpg", "jpeg"]
 
-    if export_format not in valid_formats:
-        return json.dumps(
+    if export_format not in _VALID_FORMATS:
+        return dumps(
             {
                 "success": False,
-                "error": f"Unsupported format: {export_format}. Valid formats: {', '.join(valid_formats)}",
+                "error": f"Unsupported format: {export_format}. Valid formats: {', '.join(_EXPORT_FORMATS)}",
             }
         )
 
     # Validate image dimensions
     if width is not None:
         if not (config.min_image_dimension <= width <= config.max_image_dimension):
-            return json.dumps(
+            return dumps(
                 {
                     "success": False,
                     "error": f"Width must be between {config.min_image_dimension} and {config.max_image_dimension}",
@@ -56,7 +60,7 @@ def export_scene(
             )
     if height is not None:
         if not (config.min_image_dimension <= height <= config.max_image_dimension):
-            return json.dumps(
+            return dumps(
                 {
                     "success": False,
                     "error": f"Height must be between {config.min_image_dimension} and {config.max_image_dimension}",
@@ -64,7 +68,7 @@ def export_scene(
             )
 
     try:
-        logger.info(f"export_scene: format={export_format}")
+        logger.info("export_scene: format=%s", export_format)
 
         arguments = {"format": export_format}
         if width:
@@ -72,25 +76,27 @@ def export_scene(
         if height:
             arguments["height"] = height
 
-        connection = get_connection()
-        result = connection.send_command(
-            tool_name="export_scene", arguments=arguments, request_id=request_id
-        )
+        with pooled_connection() as connection:
+            result = connection.send_command(
+                tool_name="export_scene", arguments=arguments, request_id=request_id
+            )
 
         success, text = parse_tool_response(result)
         if not success:
-            return json.dumps({"success": False, "error": text})
+            return dumps({"success": False, "error": text})
 
         # Parse the path from the response
-        if "Exported to:" in text:
-            path = text.replace("Exported to:", "").strip()
-            return json.dumps({"success": True, "path": path, "format": export_format})
+        _, marker, path = text.partition("Exported to:")
+        if marker:
+            return dumps(
+                {"success": True, "path": path.strip(), "format": export_format}
+            )
         else:
-            return json.dumps({"success": True, "result": text})
+            return dumps({"success": True, "result": text})
 
     except ConnectionError as e:
-        logger.error(f"export_scene connection error: {str(e)}")
-        return json.dumps(
+        logger.error("export_scene connection error: %s", e)
+        return dumps(
             {
                 "success": False,
                 "error": str(e),
@@ -99,10 +105,10 @@ def export_scene(
         )
 
     except (socket.timeout, json.JSONDecodeError) as e:
-        logger.error(f"export_scene communication error: {str(e)}")
-        return json.dumps({"success": False, "error": f"Communication error: {str(e)}"})
+        logger.error("export_scene communication error: %s", e)
+        return dumps({"success": False, "error": f"Communication error: {str(e)}"})
 
     except Exception as e:
         # Let unexpected errors propagate for debugging
-        logger.exception(f"export_scene unexpected error: {str(e)}")
+        logger.exception("export_scene unexpected error: %s", e)
         raise
@@ -1,21 +1,71 @@
 """get_cut_list - Generate lumber shopping list from SketchUp model."""
 
+import functools
 import json
 import logging
-from typing import Any
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Mapping
 from pathlib import Path
 
-from ..connection import get_connection, parse_tool_response
+from ..connection import parse_tool_response, pooled_connection
+from ..serialization import dumps, loads
 
 logger = logging.getLogger("SketchupMCPServer")
 
+# Ruby code to extract all groups and components with their bounding box
+# dimensions, grouped by size so repeated parts are sent once
+_CUT_LIST_RUBY = """
+groups = Hash.new { |h, k| h[k] = [] }
+model = Sketchup.active_model
+entities = model.active_entities
+
+entities.grep(Sketchup::Group).each do |group|
+  bounds = group.bounds
+  # Get dimensions in mm
+  width = bounds.width.to_mm
+  height = bounds.height.to_mm
+  depth = bounds.depth.to_mm
+
+  # Sort dimensions to get length (longest), width, thickness (shortest)
+  dims = [width, height, depth].sort!.reverse!
+
+  key = [dims[0].round, dims[1].round, dims[2].round]
+  groups[key] << (group.name.empty? ? "Unnamed" : group.name)
+end
+
+entities.grep(Sketchup::ComponentInstance).each do |comp|
+  bounds = comp.bounds
+  dims = [bounds.width.to_mm, bounds.height.to_mm, bounds.depth.to_mm].sort!.reverse!
+
+  key = [dims[0].round, dims[1].round, dims[2].round]
+  groups[key] << comp.definition.name
+end
+
+# One [length, width, thickness, names] row per size
+groups.map { |dims, names| dims + [names] }.to_json
+"""
+
 
-def load_lumber_standards() -> dict:
+def _freeze(value: Any) -> Any:
+    """Recursively convert parsed JSON into read-only mappings and tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@functools.cache
+def load_lumber_standards() -> Mapping[str, Any]:
     """
     Load regional lumber standards from resources.
 
+    The file is read once per process; failures are not cached.
+
     Returns:
-        Dict of regional lumber standards
+        Read-only mapping of regional lumber standards; region data is
+        frozen too, since the cached result is shared between calls
 
     Raises:
         ValueError: If standards file is missing or corrupted
@@ -24,20 +74,21 @@ def load_lumber_standards() -> dict:
         Path(__file__).parent.parent / "resources" / "lumber_standards.json"
     )
     try:
-        with open(resources_path, encoding="utf-8") as f:
-            return json.load(f)
+        return _freeze(loads(resources_path.read_bytes()))
     except FileNotFoundError:
-        logger.error(f"Lumber standards file not found at {resources_path}")
+        logger.error("Lumber standards file not found at %s", resources_path)
         raise ValueError(
             f"Regional lumber standards configuration is missing. "
             f"Expected file at: {resources_path}"
         )
     except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in lumber standards file: {e}")
+        logger.error("Invalid JSON in lumber standards file: %s", e)
         raise ValueError(f"Regional lumber standards file is corrupted: {e}")
 
 
-def get_cut_list(region: str = "australia", request_id: Any = None) -> str:
+def get_cut_list(
+    region: str = "australia", summary_only: bool = False, request_id: Any = None
+) -> str:
     """
     Generate a cut list (lumber shopping list) from the current SketchUp model.
 
@@ -46,13 +97,15 @@ def get_cut_list(region: str = "australia", request_id: Any = None) -> str:
 
     Args:
         region: Region for lumber sizing ("australia", "north_america", "uk", "europe")
+        summary_only: Return only the piece count and total volume, without the
+            per-size cut_list (and its part names)
         request_id: Optional request ID for tracking
 
     Returns:
         JSON string with cut_list array and total board feet/meters
     """
     try:
-        logger.info(f"get_cut_list: region={region}")
+        logger.info("get_cut_list: region=%s", region)
 
         # Load lumber standards for region
         standards = load_lumber_standards()
@@ -62,15 +115,16 @@ def get_cut_list(region: str = "australia", request_id: Any = None) -> str:
             available_regions = list(standards.keys())
             if "australia" in standards:
                 logger.warning(
-                    f"Unknown region '{region}', falling back to australia. "
-                    f"Available: {available_regions}"
+                    "Unknown region '%s', falling back to australia. Available: %s",
+                    region,
+                    available_regions,
                 )
                 region_data = standards["australia"]
                 region_warning = (
                     f"Note: Region '{region}' not found, using Australian standards"
                 )
             else:
-                return json.dumps(
+                return dumps(
                     {
                         "success": False,
                         "error": f"Unknown region '{region}' and no fallback available. "
@@ -83,106 +137,47 @@ def get_cut_list(region: str = "australia", request_id: Any = None) -> str:
 
         units = region_data.get("units", "mm")
 
-        # Ruby code to extract all groups and components with their bounding box dimensions
-        ruby_code = """
-result = []
-model = Sketchup.active_model
-entities = model.active_entities
-
-entities.grep(Sketchup::Group).each do |group|
-  bounds = group.bounds
-  # Get dimensions in mm
-  width = bounds.width.to_mm
-  height = bounds.height.to_mm
-  depth = bounds.depth.to_mm
-
-  # Sort dimensions to get length (longest), width, thickness (shortest)
-  dims = [width, height, depth].sort.reverse
-
-  result << {
-    "name" => group.name.empty? ? "Unnamed" : group.name,
-    "length" => dims[0].round(1),
-    "width" => dims[1].round(1),
-    "thickness" => dims[2].round(1)
-  }
-end
-
-entities.grep(Sketchup::ComponentInstance).each do |comp|
-  bounds = comp.bounds
-  dims = [bounds.width.to_mm, bounds.height.to_mm, bounds.depth.to_mm].sort.reverse
-
-  result << {
-    "name" => comp.definition.name,
-    "length" => dims[0].round(1),
-    "width" => dims[1].round(1),
-    "thickness" => dims[2].round(1)
-  }
-end
-
-result.to_json
-"""
-
-        connection = get_connection()
-        eval_result = connection.send_command(
-            tool_name="eval_ruby", arguments={"code": ruby_code}, request_id=request_id
-        )
+        with pooled_connection() as connection:
+            eval_result = connection.send_command(
+                tool_name="eval_ruby",
+                arguments={"code": _CUT_LIST_RUBY},
+                request_id=request_id,
+            )
 
         success, text = parse_tool_response(eval_result)
 
         if not success:
-            return json.dumps(
+            return dumps(
                 {"success": False, "error": f"Failed to analyze model: {text}"}
             )
 
         # Parse the result
         try:
-            pieces = json.loads(text)
+            pieces = loads(text)
         except json.JSONDecodeError:
-            return json.dumps(
+            return dumps(
                 {"success": False, "error": f"Invalid response from SketchUp: {text}"}
             )
 
-        if not pieces:
-            return json.dumps(
-                {
-                    "success": True,
-                    "cut_list": [],
-                    "message": "No groups or components found in model",
-                    "region": region,
-                }
-            )
-
-        # Group similar pieces
-        grouped = {}
-        for piece in pieces:
-            key = (piece["length"], piece["width"], piece["thickness"])
-            if key in grouped:
-                grouped[key]["quantity"] += 1
-                grouped[key]["names"].append(piece["name"])
-            else:
-                grouped[key] = {
-                    "length": piece["length"],
-                    "width": piece["width"],
-                    "thickness": piece["thickness"],
-                    "quantity": 1,
-                    "names": [piece["name"]],
-                }
-
-        # Format cut list
+        # Format cut list, longest pieces first
         cut_list = []
+        total_pieces = 0
         total_volume_mm3 = 0
 
-        for dims, data in sorted(grouped.items(), key=lambda x: -x[0][0]):
-            volume = (
-                data["length"] * data["width"] * data["thickness"] * data["quantity"]
-            )
-            total_volume_mm3 += volume
+        for length, width, thickness, names in sorted(
+            pieces, key=itemgetter(0), reverse=True
+        ):
+            quantity = len(names)
+            total_pieces += quantity
+            total_volume_mm3 += length * width * thickness * quantity
 
+            if summary_only:
+                continue
             cut_list.append(
                 {
-                    "dimensions": f"{data['thickness']:.0f}x{data['width']:.0f}x{data['length']:.0f}mm",
-                    "quantity": data["quantity"],
-                    "parts": data["names"],
+                    "dimensions": f"{thickness}x{width}x{length}mm",
+                    "quantity": quantity,
+                    "parts": names,
                     "notes": "",
                 }
             )
@@ -202,18 +197,22 @@ result.to_json
         response = {
             "success": True,
             "cut_list": cut_list,
-            "total_pieces": sum(item["quantity"] for item in cut_list),
+            "total_pieces": total_pieces,
             "total_volume": total_measure,
             "region": region,
             "units": units,
         }
+        if summary_only:
+            del response["cut_list"]
+        if not pieces:
+            response["message"] = "No groups or components found in model"
         if region_warning:
             response["warning"] = region_warning
-        return json.dumps(response)
+        return dumps(response)
 
     except ConnectionError as e:
-        logger.error(f"get_cut_list connection error: {e}")
-        return json.dumps(
+        logger.error("get_cut_list connection error: %s", e)
+        return dumps(
             {
                 "success": False,
                 "error": str(e),
@@ -222,9 +221,9 @@ result.to_json
         )
 
     except (ValueError, TypeError, KeyError) as e:
-        logger.warning(f"get_cut_list data error: {e}")
-        return json.dumps({"success": False, "error": str(e)})
+        logger.warning("get_cut_list data error: %s", e)
+        return dumps({"success": False, "error": str(e)})
 
     except Exception as e:
-        logger.exception(f"get_cut_list unexpected error: {e}")
+        logger.exception("get_cut_list unexpected error: %s", e)
         raise
@@ -1,3 +1,4 @@
+import asyncio
 import json
 from dataclasses import dataclass
 
@@ -20,7 +21,7 @@ line.entityID
 """
 
 # Call the function
-result = eval_ruby(MockContext(), test_code)
+result = asyncio.run(eval_ruby(MockContext(), test_code))
 print(f"Result: {result}")
 
 # Parse the result